@@ -2,18 +2,38 @@
 
 import os
 import shutil
+import signal
+import functools
 import subprocess
+import threading
+from collections import deque
 from pathlib import Path
-from typing import List, Optional, Tuple, Union
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple, Union
 from datetime import datetime
 from .logger import logger
 
 
+# Non-interactive apt-get install keeping existing config files
+APT_INSTALL = [
+    "apt-get", "install", "-y",
+    "-o", "Dpkg::Options::=--force-confdef",
+    "-o", "Dpkg::Options::=--force-confold",
+    "-o", "Dpkg::Use-Pty=0"
+]
+
+
+def apt_env() -> Dict[str, str]:
+    """Environment for unattended apt-get runs"""
+    return {**os.environ, "DEBIAN_FRONTEND": "noninteractive"}
+
+
 def run_command(
     cmd: Union[str, List[str]], 
     shell: bool = False,
     capture: bool = True,
-    timeout: Optional[int] = 30
+    timeout: Optional[int] = 30,
+    cwd: Optional[Union[str, Path]] = None,
+    env: Optional[Dict[str, str]] = None
 ) -> Tuple[int, str, str]:
     """
     Run a shell command and return result
@@ -23,6 +43,8 @@ def run_command(
         shell: Run through shell
         capture: Capture output
         timeout: Command timeout in seconds
+        cwd: Working directory
+        env: Environment variables (replaces the inherited environment)
     
     Returns:
         Tuple of (return_code, stdout, stderr)
@@ -38,7 +60,9 @@ def run_command(
             shell=shell,
             capture_output=capture,
             text=True,
-            timeout=timeout
+            timeout=timeout,
+            cwd=cwd,
+            env=env
         )
         
         return result.returncode, result.stdout, result.stderr
@@ -52,23 +76,140 @@ def run_command(
         return -1, "", str(e)
 
 
-def backup_file(file_path: Union[str, Path], backup_dir: Optional[Path] = None) -> Optional[Path]:
+@functools.lru_cache(maxsize=1)
+def installed_debs() -> FrozenSet[str]:
+    """
+    Names of installed Debian packages, read with one dpkg-query call
+    
+    The result is cached; call installed_debs.cache_clear() after
+    installing or removing packages.
+    """
+    ret, stdout, _ = run_command(["dpkg-query", "-W", "-f=${Package}\t${Status}\n"])
+    installed = set()
+    if ret == 0:
+        for line in stdout.splitlines():
+            name, _, status = line.partition("\t")
+            if status == "install ok installed":
+                installed.add(name)
+    
+    return frozenset(installed)
+
+
+def run_command_streaming(
+    cmd: List[str],
+    timeout: Optional[int] = None,
+    cwd: Optional[Union[str, Path]] = None,
+    env: Optional[Dict[str, str]] = None,
+    tail: int = 200,
+    on_line: Optional[Callable[[str], None]] = None,
+    log_path: Optional[Union[str, Path]] = None
+) -> Tuple[int, str]:
+    """
+    Run a long command, logging its output line by line as it is produced
+    
+    Args:
+        cmd: Command to run
+        timeout: Command timeout in seconds
+        cwd: Working directory
+        env: Environment variables (replaces the inherited environment)
+        tail: Number of trailing output lines kept for error reporting
+        on_line: Optional callback invoked with every output line
+        log_path: Optional file that receives the complete output
+    
+    Returns:
+        Tuple of (return_code, last output lines)
+    """
+    logger.debug(f"Running command: {cmd}")
+    
+    lines = deque(maxlen=tail)
+    timed_out = threading.Event()
+    
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=1,
+            text=True,
+            errors="replace",
+            cwd=cwd,
+            env=env,
+            # Own process group, so a kill also reaches make/ninja/dpkg
+            # children that would otherwise hold the output pipe open
+            start_new_session=True
+        )
+    except Exception as e:
+        logger.error(f"Command failed: {cmd} - {e}")
+        return -1, str(e)
+    
+    def kill_group():
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    
+    def kill():
+        timed_out.set()
+        kill_group()
+    
+    log_file = None
+    if log_path:
+        try:
+            log_file = open(log_path, "a")
+        except OSError as e:
+            logger.warning(f"Cannot write command log {log_path}: {e}")
+    
+    timer = threading.Timer(timeout, kill) if timeout else None
+    if timer:
+        timer.start()
+    
+    try:
+        for line in proc.stdout:
+            if log_file:
+                log_file.write(line)
+            line = line.rstrip()
+            lines.append(line)
+            logger.debug(line)
+            if on_line:
+                on_line(line)
+        proc.wait()
+    finally:
+        if timer:
+            timer.cancel()
+        if proc.poll() is None:
+            # Left the loop early, e.g. on_line raised
+            kill_group()
+            proc.wait()
+        proc.stdout.close()
+        if log_file:
+            log_file.close()
+    
+    if timed_out.is_set():
+        logger.error(f"Command timed out: {cmd}")
+        lines.append("Command timed out")
+        return -1, "\n".join(lines)
+    
+    return proc.returncode, "\n".join(lines)
+
+
+def backup_file(
+    file_path: Union[str, Path],
+    backup_dir: Optional[Path] = None,
+    missing_ok: bool = False
+) -> Optional[Path]:
     """
     Create a backup of a file
     
     Args:
         file_path: File to backup
         backup_dir: Directory to store backup (default: same directory)
+        missing_ok: Silently skip files that do not exist
     
     Returns:
         Path to backup file or None if failed
     """
     file_path = Path(file_path)
     
-    if not file_path.exists():
-        logger.warning(f"File does not exist: {file_path}")
-        return None
-    
     if backup_dir is None:
         backup_dir = file_path.parent
     else:
@@ -83,6 +224,10 @@ def backup_file(file_path: Union[str, Path], backup_dir: Optional[Path] = None)
         shutil.copy2(file_path, backup_path)
         logger.info(f"Backed up {file_path} to {backup_path}")
         return backup_path
+    except FileNotFoundError:
+        if not missing_ok:
+            logger.warning(f"File does not exist: {file_path}")
+        return None
     except Exception as e:
         logger.error(f"Failed to backup {file_path}: {e}")
         return None
@@ -124,6 +269,112 @@ def atomic_write(file_path: Union[str, Path], content: str, mode: str = "w") ->
         return False
 
 
+def atomic_write_batch(
+    items: List[Tuple[Union[str, Path], str]],
+    file_mode: Optional[int] = None
+) -> bool:
+    """
+    Write several files atomically with a single sync
+    
+    Every file is written to a temp file first, then one sync flushes them
+    all before the renames, instead of syncing once per file.
+    
+    Args:
+        items: List of (target file path, content) pairs
+        file_mode: Permissions applied to each file before it is moved in place
+    
+    Returns:
+        True if every file was written
+    """
+    temp_paths = []
+    
+    try:
+        for file_path, content in items:
+            file_path = Path(file_path)
+            temp_path = file_path.with_suffix(file_path.suffix + ".tmp")
+            temp_paths.append((temp_path, file_path))
+            with open(temp_path, "w") as f:
+                f.write(content)
+            if file_mode is not None:
+                temp_path.chmod(file_mode)
+        
+        # Sync to disk once for the whole batch
+        os.sync()
+        
+        for temp_path, file_path in temp_paths:
+            temp_path.replace(file_path)
+            logger.debug(f"Successfully wrote to {file_path}")
+        
+        return True
+    
+    except Exception as e:
+        logger.error(f"Failed to write batch of {len(items)} files: {e}")
+        for temp_path, _ in temp_paths:
+            if temp_path.exists():
+                temp_path.unlink()
+        return False
+
+
+def atomic_write_many(
+    base_dir: Union[str, Path],
+    items: List[Tuple[str, str]],
+    file_mode: Optional[int] = None
+) -> bool:
+    """
+    Atomically write several files under one directory with a single sync
+    
+    The directory is opened once and every file is created and renamed
+    relative to it, so the base path is resolved only once.
+    
+    Args:
+        base_dir: Directory the relative paths are resolved against
+        items: List of (relative path, content) pairs
+        file_mode: Permissions applied to each file before it is moved in place
+    
+    Returns:
+        True if every file was written
+    """
+    written = []
+    
+    try:
+        dir_fd = os.open(base_dir, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError as e:
+        logger.error(f"Failed to open {base_dir}: {e}")
+        return False
+    
+    try:
+        for rel_path, content in items:
+            temp_name = f"{rel_path}.tmp"
+            fd = os.open(temp_name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644,
+                         dir_fd=dir_fd)
+            written.append(temp_name)
+            if file_mode is not None:
+                os.fchmod(fd, file_mode)
+            with os.fdopen(fd, "w") as f:
+                f.write(content)
+        
+        # Sync to disk once for the whole batch
+        os.sync()
+        
+        for rel_path, _ in items:
+            os.replace(f"{rel_path}.tmp", rel_path, src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
+            logger.debug(f"Successfully wrote to {Path(base_dir) / rel_path}")
+        
+        return True
+    
+    except Exception as e:
+        logger.error(f"Failed to write {len(items)} files under {base_dir}: {e}")
+        for temp_name in written:
+            try:
+                os.unlink(temp_name, dir_fd=dir_fd)
+            except FileNotFoundError:
+                pass
+        return False
+    
+    finally:
+        os.close(dir_fd)
+
+
 def is_service_running(service_name: str) -> bool:
     """Check if a systemd service is running"""
     ret, stdout, _ = run_command(f"systemctl is-active {service_name}")
@@ -145,6 +145,7 @@ class ThermalManager:
 
 import time
 import sys
+import subprocess
 
 class FanController:
     def __init__(self):
@@ -163,7 +164,6 @@ class FanController:
     def get_temperature(self):
         try:
             # Try vcgencmd first
-            import subprocess
             result = subprocess.run(['vcgencmd', 'measure_temp'], 
                                   capture_output=True, text=True)
             if result.returncode == 0:
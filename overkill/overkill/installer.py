@@ -5,8 +5,9 @@ import os
 import sys
 import time
 import getpass
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Callable, Optional, List, Tuple
 import click
 from rich.console import Console
 from rich.panel import Panel
@@ -31,6 +32,8 @@ console = Console()
 class OverkillInstaller:
     """Complete OVERKILL system installer"""
     
+    _DIVIDER = "[cyan]" + "═" * 60 + "[/cyan]"
+    
     def __init__(self):
         self.system = get_system_detector()
         self.tui = OverkillTUI()
@@ -42,6 +45,10 @@ class OverkillInstaller:
         self.overclock = OverclockManager()
         self.thermal = ThermalManager()
         
+    def _section(self, title: str):
+        """Print a section header and divider in a single call"""
+        console.print(f"\n[red]▶▶▶ {title} ◀◀◀[/red]\n{self._DIVIDER}")
+    
     def show_banner(self):
         """Show OVERKILL banner with MAXIMUM ENTHUSIASM"""
         banner = """[red]
@@ -108,8 +115,7 @@ To cancel the installation, press CTRL+C at any time.
     
     def check_system(self) -> bool:
         """Validate system with EXTREME PREJUDICE"""
-        console.print("\n[red]▶▶▶ SYSTEM VALIDATION - PI 5 + NVME REQUIRED ◀◀◀[/red]")
-        console.print("[cyan]" + "═" * 60 + "[/cyan]")
+        self._section("SYSTEM VALIDATION - PI 5 + NVME REQUIRED")
         
         # Check for Pi 5
         if not self.system.is_pi5:
@@ -149,8 +155,7 @@ To cancel the installation, press CTRL+C at any time.
     
     def set_tty_font(self):
         """Configure TTY for TV viewing"""
-        console.print("\n[red]▶▶▶ CONFIGURING TTY FOR TV VIEWING ◀◀◀[/red]")
-        console.print("[cyan]" + "═" * 60 + "[/cyan]")
+        self._section("CONFIGURING TTY FOR TV VIEWING")
         
         if self.tty_config.is_physical_console():
             self.tty_config.configure_for_tv()
@@ -158,25 +163,34 @@ To cancel the installation, press CTRL+C at any time.
         else:
             console.print("[cyan]SSH session detected. Skipping TTY font adjustment.[/cyan]")
     
+    def _prompt_password(self) -> str:
+        """Prompt for a strong password, confirming only once it passes policy"""
+        while True:
+            password = getpass.getpass("Enter a strong password for the 'overkill' user: ")
+            
+            if not (len(password) >= 12
+                    and any(c.isdigit() for c in password)
+                    and any(c.isalpha() for c in password)):
+                console.print("[yellow]Password must be at least 12 characters and contain "
+                              "both letters and digits. Please try again.[/yellow]")
+                continue
+            
+            confirm = getpass.getpass("Confirm the password: ")
+            if password == confirm:
+                return password
+            
+            console.print("[yellow]Passwords do not match. Please try again.[/yellow]")
+    
     def create_user(self):
         """Create OVERKILL user with FULL SYSTEM ACCESS"""
-        console.print("\n[red]▶▶▶ CREATING OVERKILL USER ◀◀◀[/red]")
-        console.print("[cyan]" + "═" * 60 + "[/cyan]")
+        self._section("CREATING OVERKILL USER")
         
         if self.user_manager.user_exists("overkill"):
             console.print("[green]Overkill user already exists - GOOD[/green]")
         else:
             console.print("[green]Creating overkill user with full system access[/green]")
             
-            # Get password
-            while True:
-                password = getpass.getpass("Enter a strong password for the 'overkill' user: ")
-                confirm = getpass.getpass("Confirm the password: ")
-                
-                if password == confirm and password:
-                    break
-                else:
-                    console.print("[yellow]Passwords do not match or are empty. Please try again.[/yellow]")
+            password = self._prompt_password()
             
             if self.user_manager.create_overkill_user(password):
                 console.print("[green]Overkill user created with full permissions[/green]")
@@ -187,9 +201,8 @@ To cancel the installation, press CTRL+C at any time.
         return True
     
     def setup_infrastructure(self):
-        """Create OVERKILL INFRASTRUCTURE - BEYOND LIBREELEC"""
-        console.print("\n[red]▶▶▶ OVERKILL INFRASTRUCTURE - BEYOND LIBREELEC ◀◀◀[/red]")
-        console.print("[cyan]" + "═" * 60 + "[/cyan]")
+        """Create OVERKILL INFRASTRUCTURE - BEYOND LIBREELEC (first, on a worker thread)"""
+        self._section("OVERKILL INFRASTRUCTURE - BEYOND LIBREELEC")
         
         console.print("[green]Creating advanced directory structure...[/green]")
         self.infrastructure.create_all_directories()
@@ -197,9 +210,8 @@ To cancel the installation, press CTRL+C at any time.
         console.print("[green]Advanced infrastructure established[/green]")
     
     def install_packages(self):
-        """Install ALL PACKAGES FOR COMPLETE DOMINATION"""
-        console.print("\n[red]▶▶▶ INSTALLING COMPLETE DEPENDENCIES ◀◀◀[/red]")
-        console.print("[cyan]" + "═" * 60 + "[/cyan]")
+        """Install ALL PACKAGES FOR COMPLETE DOMINATION (main thread, owns the apt lock)"""
+        self._section("INSTALLING COMPLETE DEPENDENCIES")
         
         with Progress(
             SpinnerColumn(),
@@ -214,18 +226,16 @@ To cancel the installation, press CTRL+C at any time.
                 console.print("[red]Failed to install some packages[/red]")
     
     def optimize_kernel(self):
-        """KERNEL OPTIMIZATION - MAXIMUM PERFORMANCE"""
-        console.print("\n[red]▶▶▶ KERNEL OPTIMIZATION - MAXIMUM PERFORMANCE ◀◀◀[/red]")
-        console.print("[cyan]" + "═" * 60 + "[/cyan]")
+        """KERNEL OPTIMIZATION - MAXIMUM PERFORMANCE (after packages are installed)"""
+        self._section("KERNEL OPTIMIZATION - MAXIMUM PERFORMANCE")
         
         console.print("[green]Applying EXTREME kernel optimizations...[/green]")
         self.kernel_optimizer.apply_all_optimizations()
         console.print("[green]Kernel optimizations applied - MAXIMUM PERFORMANCE ACHIEVED[/green]")
     
     def configure_hardware(self):
-        """PI 5 HARDWARE DOMINATION - NO RESTRICTIONS"""
-        console.print("\n[red]▶▶▶ PI 5 HARDWARE DOMINATION - NO RESTRICTIONS ◀◀◀[/red]")
-        console.print("[cyan]" + "═" * 60 + "[/cyan]")
+        """PI 5 HARDWARE DOMINATION - NO RESTRICTIONS (after infrastructure exists)"""
+        self._section("PI 5 HARDWARE DOMINATION - NO RESTRICTIONS")
         
         # Apply balanced overclock by default
         from .core.config import OverclockProfile
@@ -244,9 +254,8 @@ To cancel the installation, press CTRL+C at any time.
         console.print("[yellow]Applied EXTREME overclocking - monitor your temps![/yellow]")
     
     def setup_thermal(self):
-        """INTELLIGENT THERMAL MANAGEMENT"""
-        console.print("\n[red]▶▶▶ INTELLIGENT THERMAL MANAGEMENT ◀◀◀[/red]")
-        console.print("[cyan]" + "═" * 60 + "[/cyan]")
+        """INTELLIGENT THERMAL MANAGEMENT (after infrastructure exists)"""
+        self._section("INTELLIGENT THERMAL MANAGEMENT")
         
         console.print("[green]Installing advanced fan control system...[/green]")
         if self.thermal.install_fan_control():
@@ -254,10 +263,37 @@ To cancel the installation, press CTRL+C at any time.
         else:
             console.print("[yellow]Thermal management setup failed - manual configuration needed[/yellow]")
     
+    def _run_after(self, prerequisite: Future, phase: Callable[[], None]) -> None:
+        """Run a setup phase once its prerequisite phase has finished"""
+        wait([prerequisite])
+        prerequisite.result()  # Propagate prerequisite failure
+        phase()
+    
+    def run_setup_phases(self):
+        """Run the system setup phases, overlapping the independent ones
+        
+        Dependencies: infrastructure -> {thermal, hardware} and
+        packages -> kernel. Packages stay on the main thread. The phases
+        run concurrently, so none of them may share mutable state on self.
+        """
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            infra = executor.submit(self.setup_infrastructure)
+            hardware_phases = [
+                executor.submit(self._run_after, infra, self.configure_hardware),
+                executor.submit(self._run_after, infra, self.setup_thermal)
+            ]
+            
+            self.install_packages()
+            kernel = executor.submit(self.optimize_kernel)
+            
+            phases = [infra, kernel] + hardware_phases
+            wait(phases)
+            for phase in phases:
+                phase.result()
+    
     def build_kodi(self):
         """BUILD KODI FROM SOURCE - OPTIMIZED FOR PI 5"""
-        console.print("\n[red]▶▶▶ BUILDING KODI FROM SOURCE ◀◀◀[/red]")
-        console.print("[cyan]" + "═" * 60 + "[/cyan]")
+        self._section("BUILDING KODI FROM SOURCE")
         
         if click.confirm("Build Kodi from source? (This will take 1-2 hours)"):
             from .media.kodi_builder import KodiBuilder
@@ -286,8 +322,7 @@ To cancel the installation, press CTRL+C at any time.
     
     def finalize(self):
         """FINALIZE OVERKILL INSTALLATION"""
-        console.print("\n[red]▶▶▶ FINALIZING OVERKILL INSTALLATION ◀◀◀[/red]")
-        console.print("[cyan]" + "═" * 60 + "[/cyan]")
+        self._section("FINALIZING OVERKILL INSTALLATION")
         
         console.print("[green]Setting final permissions...[/green]")
         run_command(["chown", "-R", "overkill:overkill", "/home/overkill"])
@@ -298,8 +333,16 @@ To cancel the installation, press CTRL+C at any time.
         console.print("\n[white]Ready to experience UNLIMITED POWER?[/white]")
         if click.confirm("Reboot now to apply all changes?"):
             console.print("[red]ACTIVATING OVERKILL MODE...[/red]")
-            time.sleep(3)
-            run_command(["reboot"])
+            # Hand the reboot to systemd so the installer can exit right away
+            reboot_unit = "overkill-reboot"
+            ret, _, err = run_command([
+                "systemd-run", "--on-active=3s", f"--unit={reboot_unit}", "/sbin/reboot"
+            ])
+            if ret == 0:
+                logger.info(f"Scheduled reboot via systemd unit {reboot_unit}")
+            else:
+                logger.error(f"Failed to schedule reboot: {err}")
+                console.print("[yellow]Manual activation required: sudo reboot[/yellow]")
         else:
             console.print("[yellow]Manual activation required: sudo reboot[/yellow]")
     
@@ -327,11 +370,7 @@ To cancel the installation, press CTRL+C at any time.
         if not self.create_user():
             sys.exit(1)
         
-        self.setup_infrastructure()
-        self.install_packages()
-        self.optimize_kernel()
-        self.configure_hardware()
-        self.setup_thermal()
+        self.run_setup_phases()
         self.build_kodi()
         self.show_addon_info()
         self.finalize()
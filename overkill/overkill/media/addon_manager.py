@@ -4,6 +4,7 @@ import os
 import json
 import zipfile
 import shutil
+import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from ..core.logger import logger
@@ -11,6 +12,35 @@ from ..core.utils import run_command, ensure_directory, atomic_write
 import requests
 
 
+# addon.xml templates, rendered with str.format
+_REPO_ADDON_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<addon id="{repo_addon}" name="{name}" version="1.0.0" provider-name="OVERKILL">
+    <extension point="xbmc.addon.repository" name="{name}">
+        <info compressed="false">{url}addons.xml</info>
+        <checksum>{url}addons.xml.md5</checksum>
+        <datadir zip="true">{url}</datadir>
+    </extension>
+    <extension point="xbmc.addon.metadata">
+        <summary>{name}</summary>
+        <description>{description}</description>
+        <platform>all</platform>
+    </extension>
+</addon>
+"""
+
+_ESSENTIAL_ADDON_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<addon id="{id}" name="{name}" version="1.0.0">
+    <extension point="xbmc.python.pluginsource" library="default.py">
+        <provides>video</provides>
+    </extension>
+    <extension point="xbmc.addon.metadata">
+        <summary>{name}</summary>
+        <description>{description}</description>
+    </extension>
+</addon>
+"""
+
+
 class AddonRepository:
     """Addon repository definition"""
     
@@ -31,6 +61,8 @@ class AddonManager:
         self.addons_dir = self.kodi_home / "addons"
         self.userdata = self.kodi_home / "userdata"
         self.temp_dir = Path("/tmp/overkill-addons")
+        self._dirs_ready = False
+        self._kodi_installed = False
         
         # Define known repositories
         self.repositories = {
@@ -133,7 +165,19 @@ class AddonManager:
     
     def check_kodi_installed(self) -> bool:
         """Check if Kodi is installed and configured"""
-        return self.kodi_home.exists() and self.addons_dir.exists()
+        # Only a positive result is cached, Kodi may get installed later
+        if not self._kodi_installed:
+            self._kodi_installed = self.kodi_home.exists() and self.addons_dir.exists()
+        return self._kodi_installed
+    
+    def _ensure_dirs(self):
+        """Create the Kodi directories we write into, once per manager"""
+        if self._dirs_ready:
+            return
+        
+        for directory in (self.addons_dir, self.userdata):
+            ensure_directory(directory)
+        self._dirs_ready = True
     
     def install_repository(self, repo_name: str) -> Tuple[bool, str]:
         """Install a repository and its addons"""
@@ -145,9 +189,7 @@ class AddonManager:
         
         try:
             # Ensure Kodi directories exist
-            ensure_directory(self.addons_dir)
-            ensure_directory(self.userdata)
-            ensure_directory(self.temp_dir)
+            self._ensure_dirs()
             
             # Download repository ZIP
             success, message = self._download_repository(repo)
@@ -160,7 +202,7 @@ class AddonManager:
                 self._install_addon_dependency(dep)
             
             # Enable repository in Kodi
-            self._enable_addon(repo.addons[0])  # First addon is usually the repo
+            self._bulk_enable_addons([repo.addons[0]])  # First addon is usually the repo
             
             # Create sources entry
             self._add_to_sources(repo)
@@ -184,20 +226,12 @@ class AddonManager:
         ensure_directory(addon_path)
         
         # Create addon.xml
-        addon_xml = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
-<addon id="{repo_addon}" name="{repo.name}" version="1.0.0" provider-name="OVERKILL">
-    <extension point="xbmc.addon.repository" name="{repo.name}">
-        <info compressed="false">{repo.url}addons.xml</info>
-        <checksum>{repo.url}addons.xml.md5</checksum>
-        <datadir zip="true">{repo.url}</datadir>
-    </extension>
-    <extension point="xbmc.addon.metadata">
-        <summary>{repo.name}</summary>
-        <description>{repo.description}</description>
-        <platform>all</platform>
-    </extension>
-</addon>
-"""
+        addon_xml = _REPO_ADDON_XML.format(
+            repo_addon=repo_addon,
+            name=repo.name,
+            url=repo.url,
+            description=repo.description
+        )
         
         addon_xml_path = addon_path / "addon.xml"
         if not atomic_write(addon_xml_path, addon_xml):
@@ -216,18 +250,35 @@ class AddonManager:
         # In a real implementation, this would download from Kodi repo
         logger.debug(f"Would install dependency: {addon_id}")
     
-    def _enable_addon(self, addon_id: str):
-        """Enable addon in Kodi database"""
-        # Create enabled addons file if not exists
+    def _bulk_enable_addons(self, addon_ids: List[str]) -> bool:
+        """Enable addons in Kodi with a single read and write of the enabled list"""
         enabled_file = self.userdata / "addon_data" / "enabled_addons.xml"
         ensure_directory(enabled_file.parent)
         
-        if not enabled_file.exists():
-            content = '<?xml version="1.0" encoding="UTF-8"?>\n<addons>\n</addons>'
-            atomic_write(enabled_file, content)
+        try:
+            if enabled_file.exists():
+                root = ET.parse(enabled_file).getroot()
+            else:
+                root = ET.Element("addons")
+            
+            already_enabled = {addon.get("id") for addon in root.iter("addon")}
+            root.extend(
+                ET.Element("addon", id=addon_id, enabled="true")
+                for addon_id in addon_ids
+                if addon_id not in already_enabled
+            )
+            
+            content = ET.tostring(root, xml_declaration=True, encoding="utf-8")
+            if not atomic_write(enabled_file, content, mode="wb"):
+                return False
+            
+        except Exception as e:
+            logger.error(f"Failed to enable addons: {e}")
+            return False
         
-        # In a real implementation, properly parse and update XML
-        logger.info(f"Enabled addon: {addon_id}")
+        for addon_id in addon_ids:
+            logger.info(f"Enabled addon: {addon_id}")
+        return True
     
     def _add_to_sources(self, repo: AddonRepository):
         """Add repository to sources.xml"""
@@ -239,36 +290,35 @@ class AddonManager:
     def install_essential_addons(self) -> Dict[str, bool]:
         """Install essential/recommended addons"""
         results = {}
+        self._ensure_dirs()
         
-        for addon_id, addon_info in self.essential_addons.items():
+        # Render every addon.xml up front
+        payloads = [
+            (addon_id, addon_info, self.addons_dir / addon_info['id'],
+             _ESSENTIAL_ADDON_XML.format_map(addon_info))
+            for addon_id, addon_info in self.essential_addons.items()
+        ]
+        
+        for addon_id, addon_info, addon_path, addon_xml in payloads:
             logger.info(f"Installing {addon_info['name']}...")
             try:
                 # Simplified - would actually download and install
-                addon_path = self.addons_dir / addon_info['id']
                 ensure_directory(addon_path)
+                results[addon_id] = atomic_write(addon_path / "addon.xml", addon_xml)
                 
-                # Create basic addon.xml
-                addon_xml = f"""<?xml version="1.0" encoding="UTF-8"?>
-<addon id="{addon_info['id']}" name="{addon_info['name']}" version="1.0.0">
-    <extension point="xbmc.python.pluginsource" library="default.py">
-        <provides>video</provides>
-    </extension>
-    <extension point="xbmc.addon.metadata">
-        <summary>{addon_info['name']}</summary>
-        <description>{addon_info['description']}</description>
-    </extension>
-</addon>
-"""
-                addon_xml_path = addon_path / "addon.xml"
-                atomic_write(addon_xml_path, addon_xml)
-                
-                results[addon_id] = True
-                logger.info(f"Installed {addon_info['name']}")
+                if results[addon_id]:
+                    logger.info(f"Installed {addon_info['name']}")
                 
             except Exception as e:
                 logger.error(f"Failed to install {addon_info['name']}: {e}")
                 results[addon_id] = False
         
+        # Enable everything that installed in one write
+        installed_ids = [self.essential_addons[addon_id]['id']
+                         for addon_id, success in results.items() if success]
+        if installed_ids:
+            self._bulk_enable_addons(installed_ids)
+        
         return results
     
     def configure_real_debrid(self, api_key: str) -> bool:
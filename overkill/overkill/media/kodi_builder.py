@@ -1,13 +1,20 @@
 """Build Kodi from source with Pi 5 optimizations"""
 
 import os
+import re
+import json
+import hashlib
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional, Dict
 from datetime import datetime
 from ..core.logger import logger
-from ..core.utils import run_command, ensure_directory
+from ..core.utils import (
+    APT_INSTALL, apt_env, installed_debs, run_command, run_command_streaming,
+    ensure_directory, atomic_write
+)
 
 
 class KodiBuilder:
@@ -20,18 +27,39 @@ class KodiBuilder:
         self.kodi_repo = "https://github.com/xbmc/xbmc.git"
         self.build_type = "Release"
         self.cpu_count = os.cpu_count() or 4
-        
-        # Pi 5 specific optimizations
+        self.ccache_dir = self.build_dir.parent / ".ccache"
+        self.ccache_maxsize = "10G"
+        self.build_tmpfs: Optional[Path] = None
+        self._build_progress = 0
+        
+        # Optional two-pass profile-guided build
+        self.enable_pgo = False
+        self.pgo_dir = self.build_dir.parent / "pgo"
+        self.pgo_playlist = Path("/opt/overkill/pgo/sample.m3u")
+        self._pgo_base_flags: Dict[str, str] = {}
+        self._source_unchanged = False
+        
+        # Pi 5 specific optimizations: -mcpu sets both ISA and scheduling,
+        # with the Cortex-A76 CRC/AES/SHA2 extensions spelled out
+        compiler_flags = "-mcpu=cortex-a76+crc+crypto+aes+sha2 -O3 -pipe -flto=auto"
+        linker_flags = "-Wl,-O1 -Wl,--as-needed -flto=auto -fuse-ld=mold"
         self.cmake_flags = {
             "CMAKE_BUILD_TYPE": self.build_type,
             "CMAKE_INSTALL_PREFIX": str(self.install_prefix),
-            "CMAKE_C_FLAGS": "-march=armv8.2-a+crypto+fp16+rcpc+dotprod -mtune=cortex-a76 -O3 -pipe",
-            "CMAKE_CXX_FLAGS": "-march=armv8.2-a+crypto+fp16+rcpc+dotprod -mtune=cortex-a76 -O3 -pipe",
-            "ENABLE_INTERNAL_FLATBUFFERS": "ON",
-            "ENABLE_INTERNAL_RapidJSON": "ON",
-            "ENABLE_INTERNAL_FMT": "ON",
-            "ENABLE_INTERNAL_SPDLOG": "ON",
-            "ENABLE_INTERNAL_CROSSGUID": "ON",
+            "CMAKE_C_FLAGS": compiler_flags,
+            "CMAKE_CXX_FLAGS": compiler_flags,
+            "CMAKE_EXE_LINKER_FLAGS": linker_flags,
+            "CMAKE_SHARED_LINKER_FLAGS": linker_flags,
+            # LTO-aware archive tools so static helper libs keep their IR
+            "CMAKE_AR": "gcc-ar",
+            "CMAKE_RANLIB": "gcc-ranlib",
+            "CMAKE_NM": "gcc-nm",
+            # Link the distro libraries instead of building bundled copies
+            "ENABLE_INTERNAL_FLATBUFFERS": "OFF",
+            "ENABLE_INTERNAL_RapidJSON": "OFF",
+            "ENABLE_INTERNAL_FMT": "OFF",
+            "ENABLE_INTERNAL_SPDLOG": "OFF",
+            "ENABLE_INTERNAL_CROSSGUID": "OFF",
             "ENABLE_VAAPI": "OFF",  # Not available on Pi
             "ENABLE_VDPAU": "OFF",  # Not available on Pi
             "CORE_PLATFORM_NAME": "gbm",
@@ -43,20 +71,30 @@ class KodiBuilder:
             "ENABLE_AVAHI": "ON",
             "ENABLE_AIRTUNES": "ON",
             "ENABLE_OPTICAL": "ON",
-            "ENABLE_DVDCSS": "ON"
+            "ENABLE_DVDCSS": "ON",
+            # Compiler cache for incremental rebuilds; Kodi's own ccache
+            # detection is disabled so objects are not cached twice
+            "CMAKE_C_COMPILER_LAUNCHER": "ccache",
+            "CMAKE_CXX_COMPILER_LAUNCHER": "ccache",
+            "ENABLE_CCACHE": "OFF",
+            # Never run the multi-GB link steps concurrently
+            "CMAKE_JOB_POOLS": "link=1",
+            "CMAKE_JOB_POOL_LINK": "link"
         }
         
-        # Build dependencies
+        # Build dependencies, installed without their recommends
+        self._apt_install = APT_INSTALL + ["--no-install-recommends"]
         self.build_deps = [
-            "autoconf", "automake", "autopoint", "gettext", "autotools-dev",
+            "ccache", "autoconf", "automake", "autopoint", "gettext", "autotools-dev",
             "cmake", "curl", "default-jre", "gawk", "gcc", "g++", "cpp",
             "flatbuffers-compiler", "gdc", "gperf", "libasound2-dev",
             "libass-dev", "libavahi-client-dev", "libavahi-common-dev",
             "libbluetooth-dev", "libbluray-dev", "libbz2-dev", "libcdio-dev",
             "libcec-dev", "libp8-platform-dev", "libcrossguid-dev",
             "libcurl4-openssl-dev", "libcwiid-dev", "libdbus-1-dev",
-            "libegl1-mesa-dev", "libenca-dev", "libflac-dev", "libfontconfig-dev",
-            "libfmt-dev", "libfreetype6-dev", "libfribidi-dev", "libfstrcmp-dev",
+            "libegl1-mesa-dev", "libenca-dev", "libflac-dev", "libflatbuffers-dev",
+            "libfontconfig-dev", "libfmt-dev", "libfreetype6-dev", "libfribidi-dev",
+            "libfstrcmp-dev",
             "libgbm-dev", "libgcrypt20-dev", "libgif-dev", "libgles2-mesa-dev",
             "libgl1-mesa-dev", "libglu1-mesa-dev", "libgnutls28-dev",
             "libgpg-error-dev", "libgtest-dev", "libinput-dev", "libiso9660-dev",
@@ -68,31 +106,79 @@ class KodiBuilder:
             "libtag1-dev", "libtiff5-dev", "libtinyxml-dev", "libudev-dev",
             "libunistring-dev", "libva-dev", "libvorbis-dev", "libxkbcommon-dev",
             "libxmu-dev", "libxrandr-dev", "libxslt1-dev", "libxt-dev",
-            "lsb-release", "meson", "nasm", "ninja-build", "python3-dev",
+            "lsb-release", "meson", "mold", "nasm", "ninja-build", "python3-dev",
             "python3-pil", "python3-pip", "rapidjson-dev", "swig", "unzip",
             "uuid-dev", "vainfo", "wayland-protocols", "waylandpp-dev", "zip", "zlib1g-dev"
         ]
     
+    def _ccache_env(self) -> Dict[str, str]:
+        """Environment for commands that compile through ccache"""
+        return {
+            **os.environ,
+            "CCACHE_DIR": str(self.ccache_dir),
+            "CCACHE_MAXSIZE": self.ccache_maxsize,
+            "CCACHE_COMPILERCHECK": "content",
+            "CCACHE_COMPRESS": "true",
+            "CCACHE_COMPRESSLEVEL": "4",
+            "CCACHE_SLOPPINESS": "include_file_mtime,time_macros,pch_defines"
+        }
+    
+    def _select_ccache_dir(self) -> None:
+        """Move the compiler cache onto an attached SSD when one is mounted"""
+        for mountpoint in ("/mnt/ssd", "/overkill/ssd"):
+            if os.path.ismount(mountpoint):
+                self.ccache_dir = Path(mountpoint) / "ccache"
+                self.ccache_maxsize = "50G"
+                logger.info(f"Using compiler cache on SSD: {self.ccache_dir}")
+                return
+    
+    def _update_package_list(self) -> bool:
+        """Refresh the apt package list"""
+        ret, _ = run_command_streaming(["apt-get", "update"], timeout=300,
+                                       env=apt_env())
+        if ret != 0:
+            logger.error("Failed to update package list")
+            return False
+        return True
+    
     def prepare_build_environment(self) -> bool:
         """Install all build dependencies"""
         logger.info("Installing Kodi build dependencies...")
         
-        # Update package list
-        ret, _, _ = run_command(["apt-get", "update"])
-        if ret != 0:
-            logger.error("Failed to update package list")
+        self._select_ccache_dir()
+        
+        if not self._update_package_list():
             return False
         
-        # Install dependencies in chunks to avoid command line length issues
-        chunk_size = 20
-        for i in range(0, len(self.build_deps), chunk_size):
-            chunk = self.build_deps[i:i + chunk_size]
-            logger.info(f"Installing dependencies chunk {i//chunk_size + 1}...")
+        # Fetch every archive first (no dpkg lock needed), so the install
+        # below is purely local and network failures surface on their own
+        ret, err = run_command_streaming(self._apt_install + ["--download-only"] + self.build_deps,
+                                         timeout=1800, env=apt_env())
+        if ret != 0:
+            logger.warning(f"Failed to download dependencies: {err}")
+        
+        # One apt transaction resolves and unpacks everything in a single pass
+        ret, err = run_command_streaming(self._apt_install + self.build_deps,
+                                         timeout=3600, env=apt_env())
+        installed_debs.cache_clear()
+        if ret != 0:
+            logger.error(f"Failed to install dependencies: {err}")
+            # A single unknown package name aborts the whole transaction, so
+            # retry what is still missing one by one
+            installed = installed_debs()
+            failed = []
+            for package in self.build_deps:
+                if package in installed:
+                    continue
+                ret, _, _ = run_command(self._apt_install + [package], timeout=300,
+                                        env=apt_env())
+                if ret != 0:
+                    failed.append(package)
+            installed_debs.cache_clear()
             
-            ret, _, err = run_command(["apt-get", "install", "-y"] + chunk, timeout=600)
-            if ret != 0:
-                logger.error(f"Failed to install dependencies: {err}")
+            if failed:
                 # Continue anyway, some might be optional
+                logger.warning(f"Failed to install: {', '.join(failed)}")
         
         # Install Python dependencies
         python_deps = ["mako", "requests", "setuptools"]
@@ -104,16 +190,34 @@ class KodiBuilder:
         """Clone or update Kodi source code"""
         ensure_directory(self.build_dir)
         
+        self._source_unchanged = False
+        
         if self.source_dir.exists():
             logger.info("Updating existing Kodi source...")
-            ret, _, err = run_command(["git", "pull"], cwd=self.source_dir)
+            # Fetch + hard reset instead of pull, so force-pushed branches
+            # never leave a merge to resolve
+            git = ["git", "-C", str(self.source_dir)]
+            ret, _, err = run_command(git + ["fetch", "--depth=1", "origin", branch],
+                                      timeout=600)
+            if ret == 0:
+                ret, stdout, err = run_command(git + ["rev-parse", "HEAD", "FETCH_HEAD"])
+            if ret == 0:
+                head, fetched = stdout.split()
+                if head == fetched:
+                    logger.info("Kodi source already up to date")
+                    self._source_unchanged = True
+                    return True
+                ret, _, err = run_command(git + ["reset", "--hard", "FETCH_HEAD"])
+            
             if ret != 0:
                 logger.error(f"Failed to update source: {err}")
                 return False
         else:
             logger.info(f"Cloning Kodi source (branch: {branch})...")
+            # Blobless clone defers blob downloads until checkout
             ret, _, err = run_command([
-                "git", "clone", "-b", branch, "--depth", "1",
+                "git", "clone", "--filter=blob:none", "--depth=1", "--single-branch",
+                "-b", branch, "--jobs", str(self.cpu_count),
                 self.kodi_repo, str(self.source_dir)
             ], timeout=600)
             
@@ -123,13 +227,121 @@ class KodiBuilder:
         
         return True
     
+    def _config_fingerprint(self) -> str:
+        """Fingerprint of the CMake flags and source revision"""
+        fingerprint = hashlib.sha256(
+            json.dumps(self.cmake_flags, sort_keys=True).encode()
+        ).hexdigest()
+        
+        ret, stdout, _ = run_command(["git", "-C", str(self.source_dir), "rev-parse", "HEAD"])
+        if ret == 0:
+            fingerprint += f"-{stdout.strip()}"
+        
+        return fingerprint
+    
+    def _mount_build_tmpfs(self, build_path: Path) -> None:
+        """Keep build intermediates in RAM on boards with memory to spare"""
+        if os.path.ismount(build_path):
+            # Left behind by an interrupted build; adopt it so it is released
+            try:
+                with open("/proc/mounts", 'r') as f:
+                    mounts = [line.split() for line in f]
+            except Exception as e:
+                logger.debug(f"Failed to read mounts: {e}")
+                return
+            if any(m[1] == str(build_path) and m[2] == "tmpfs" for m in mounts):
+                self.build_tmpfs = build_path
+                logger.info(f"Reusing tmpfs build directory at {build_path}")
+            return
+        
+        try:
+            with open("/proc/meminfo", 'r') as f:
+                total_kb = int(f.readline().split()[1])
+        except Exception as e:
+            logger.debug(f"Failed to read total memory: {e}")
+            return
+        
+        total_gb = total_kb / (1024 ** 2)
+        if total_gb < 6:
+            logger.debug("Not enough memory for a tmpfs build directory")
+            return
+        
+        # Keep at least 2GB outside the tmpfs; _safe_jobs lowers the job
+        # count to fit whatever memory the tmpfs may still take
+        size_gb = min(5, int(total_gb - 2))
+        
+        ret, _, err = run_command([
+            "mount", "-t", "tmpfs", "-o", f"size={size_gb}G,noatime", "tmpfs", str(build_path)
+        ])
+        if ret != 0:
+            logger.warning(f"Failed to mount tmpfs build directory: {err}")
+            return
+        
+        self.build_tmpfs = build_path
+        logger.info(f"Building in tmpfs at {build_path}")
+    
+    def _unmount_build_tmpfs(self) -> None:
+        """Release the tmpfs build directory"""
+        if self.build_tmpfs is None:
+            return
+        
+        ret, _, err = run_command(["umount", str(self.build_tmpfs)])
+        if ret != 0:
+            logger.warning(f"Failed to unmount tmpfs build directory: {err}")
+            return
+        
+        self.build_tmpfs = None
+    
+    def _verify_system_libs(self) -> None:
+        """Fall back to Kodi's bundled copy of any missing system library"""
+        pkgconfig_modules = {
+            "ENABLE_INTERNAL_FMT": "fmt",
+            "ENABLE_INTERNAL_SPDLOG": "spdlog",
+            "ENABLE_INTERNAL_FLATBUFFERS": "flatbuffers",
+            "ENABLE_INTERNAL_RapidJSON": "RapidJSON"
+        }
+        
+        for flag, module in pkgconfig_modules.items():
+            ret, _, _ = run_command(["pkg-config", "--exists", module])
+            if ret != 0:
+                logger.warning(f"System {module} not found, using bundled copy")
+                self.cmake_flags[flag] = "ON"
+        
+        # crossguid ships no pkg-config file; dpkg -s would also accept a
+        # removed package that only left its config files behind
+        if "libcrossguid-dev" not in installed_debs():
+            logger.warning("System crossguid not found, using bundled copy")
+            self.cmake_flags["ENABLE_INTERNAL_CROSSGUID"] = "ON"
+    
+    def _select_linker(self) -> None:
+        """Use mold when available, otherwise gold"""
+        if shutil.which("mold"):
+            return
+        
+        logger.warning("mold not found, linking with gold")
+        for key in ("CMAKE_EXE_LINKER_FLAGS", "CMAKE_SHARED_LINKER_FLAGS"):
+            self.cmake_flags[key] = self.cmake_flags[key].replace(
+                "-fuse-ld=mold", "-fuse-ld=gold"
+            )
+    
     def configure_build(self) -> bool:
         """Configure Kodi build with CMake"""
         build_path = self.source_dir / "build"
         ensure_directory(build_path)
+        self._mount_build_tmpfs(build_path)
+        self._verify_system_libs()
+        self._select_linker()
+        
+        # Skip reconfiguring when neither flags nor source have changed
+        fingerprint = self._config_fingerprint()
+        fingerprint_file = build_path / ".overkill_config_hash"
+        if (build_path / "CMakeCache.txt").exists() and fingerprint_file.exists():
+            if fingerprint_file.read_text().strip() == fingerprint:
+                logger.info("Build configuration unchanged (config cache hit)")
+                return True
         
         # Prepare CMake arguments
-        cmake_args = ["cmake"]
+        cmake_args = ["cmake", "-G", "Ninja"]
         for key, value in self.cmake_flags.items():
             cmake_args.append(f"-D{key}={value}")
         cmake_args.append("..")
@@ -137,15 +349,62 @@ class KodiBuilder:
         logger.info("Configuring Kodi build...")
         logger.debug(f"CMake arguments: {' '.join(cmake_args)}")
         
-        ret, stdout, err = run_command(cmake_args, cwd=build_path, timeout=300)
+        ensure_directory(self.ccache_dir)
+        ret, stdout, err = run_command(cmake_args, cwd=build_path, timeout=300,
+                                       env=self._ccache_env())
         
         if ret != 0:
             logger.error(f"CMake configuration failed: {err}")
             return False
         
+        atomic_write(fingerprint_file, fingerprint)
         logger.info("Build configuration complete")
         return True
     
+    def _safe_jobs(self) -> int:
+        """Parallel job count capped by available memory and CPU temperature"""
+        jobs = self.cpu_count
+        
+        # Heavy Kodi translation units need well over 1GB RSS each
+        try:
+            with open("/proc/meminfo", 'r') as f:
+                for line in f:
+                    if line.startswith("MemAvailable:"):
+                        mem_gb = int(line.split()[1]) / (1024 ** 2)
+                        break
+            
+            # The tmpfs build directory grows into that memory as the
+            # build writes objects, so reserve its remaining room
+            if self.build_tmpfs is not None:
+                stat = os.statvfs(self.build_tmpfs)
+                mem_gb -= stat.f_bavail * stat.f_frsize / (1024 ** 3)
+            
+            jobs = min(jobs, max(1, int(mem_gb // 1.5)))
+        except Exception as e:
+            logger.debug(f"Failed to read available memory: {e}")
+        
+        # Back off one job when already running hot
+        try:
+            with open("/sys/class/thermal/thermal_zone0/temp", 'r') as f:
+                if float(f.read().strip()) / 1000.0 > 75:
+                    jobs = max(1, jobs - 1)
+        except Exception as e:
+            logger.debug(f"Failed to read temperature: {e}")
+        
+        return jobs
+    
+    def _log_build_progress(self, line: str) -> None:
+        """Log build progress every 10% from Ninja's [N/M] status prefix"""
+        match = re.match(r"\[(\d+)/(\d+)\]", line)
+        if not match:
+            return
+        
+        done, total = int(match.group(1)), int(match.group(2))
+        percent = done * 100 // total
+        if percent // 10 > self._build_progress // 10:
+            logger.info(f"Build progress: {percent}% ({done}/{total})")
+        self._build_progress = percent
+    
     def build_kodi(self) -> bool:
         """Build Kodi with maximum optimization"""
         build_path = self.source_dir / "build"
@@ -154,17 +413,21 @@ class KodiBuilder:
             logger.error("Build directory not found. Run configure first.")
             return False
         
-        logger.info(f"Building Kodi with {self.cpu_count} parallel jobs...")
+        jobs = self._safe_jobs()
+        logger.info(f"Building Kodi with {jobs} parallel jobs...")
         logger.info("This will take 30-60 minutes on Pi 5...")
         
         # Create build timestamp
         start_time = datetime.now()
+        self._build_progress = 0
         
-        # Build with make
-        ret, _, err = run_command(
-            ["make", f"-j{self.cpu_count}"],
+        # Let CMake drive Ninja across the safe number of cores
+        ret, err = run_command_streaming(
+            ["cmake", "--build", ".", "--parallel", str(jobs)],
             cwd=build_path,
-            timeout=7200  # 2 hours timeout
+            timeout=7200,  # 2 hours timeout
+            env=self._ccache_env(),
+            on_line=self._log_build_progress
         )
         
         if ret != 0:
@@ -174,6 +437,10 @@ class KodiBuilder:
         build_time = (datetime.now() - start_time).total_seconds() / 60
         logger.info(f"Build completed in {build_time:.1f} minutes")
         
+        ret, stdout, _ = run_command(["ccache", "-s"], env=self._ccache_env())
+        if ret == 0:
+            logger.info(f"ccache statistics:\n{stdout.strip()}")
+        
         return True
     
     def install_kodi(self) -> bool:
@@ -183,7 +450,7 @@ class KodiBuilder:
         logger.info(f"Installing Kodi to {self.install_prefix}")
         
         ret, _, err = run_command(
-            ["make", "install"],
+            ["cmake", "--install", "."],
             cwd=build_path,
             timeout=300
         )
@@ -192,11 +459,52 @@ class KodiBuilder:
             logger.error(f"Installation failed: {err}")
             return False
         
-        # Create symlinks in /usr/local/bin
-        self._create_symlinks()
+        return True
+    
+    def _set_profile_flags(self, profile_flags: str) -> None:
+        """Append profile flags to the compiler and executable linker flags"""
+        for key in ("CMAKE_C_FLAGS", "CMAKE_CXX_FLAGS", "CMAKE_EXE_LINKER_FLAGS"):
+            base = self._pgo_base_flags.setdefault(key, self.cmake_flags[key])
+            self.cmake_flags[key] = f"{base} {profile_flags}"
+    
+    def _train_profile(self) -> bool:
+        """Run the instrumented Kodi on the sample playlist to collect profiles"""
+        kodi_bin = self.install_prefix / "bin" / "kodi"
+        logger.info("Collecting PGO profile (3 minutes)...")
+        
+        cmd = ["timeout", "180", str(kodi_bin)]
+        if self.pgo_playlist.exists():
+            cmd.append(str(self.pgo_playlist))
+        else:
+            logger.warning(f"PGO playlist not found: {self.pgo_playlist}")
+        
+        # timeout exits 124 once Kodi has run its course
+        run_command(cmd, timeout=240)
+        
+        if not any(self.pgo_dir.rglob("*.gcda")):
+            logger.error("Instrumented Kodi produced no profile data")
+            return False
         
         return True
     
+    def build_kodi_pgo(self) -> bool:
+        """Configure and build Kodi twice, optimizing with a training profile"""
+        if self.pgo_dir.exists():
+            shutil.rmtree(self.pgo_dir)
+        ensure_directory(self.pgo_dir)
+        
+        logger.info("PGO pass 1: instrumented build")
+        self._set_profile_flags(f"-fprofile-generate={self.pgo_dir}")
+        if not (self.configure_build() and self.build_kodi() and self.install_kodi()):
+            return False
+        
+        if not self._train_profile():
+            return False
+        
+        logger.info("PGO pass 2: optimized build")
+        self._set_profile_flags(f"-fprofile-use={self.pgo_dir} -fprofile-correction")
+        return self.configure_build() and self.build_kodi()
+    
     def _create_symlinks(self):
         """Create symlinks for easy access"""
         symlinks = {
@@ -206,18 +514,18 @@ class KodiBuilder:
         
         for link, target in symlinks.items():
             try:
-                if Path(link).exists():
-                    Path(link).unlink()
+                Path(link).unlink(missing_ok=True)
                 Path(link).symlink_to(target)
                 logger.info(f"Created symlink: {link} -> {target}")
             except Exception as e:
                 logger.warning(f"Failed to create symlink {link}: {e}")
     
-    def create_systemd_service(self) -> bool:
-        """Create systemd service for Kodi"""
+    def _write_systemd_service(self) -> bool:
+        """Write the Kodi systemd unit file"""
         service_content = """[Unit]
 Description=OVERKILL Kodi Media Center
-After=multi-user.target network.target
+After=graphical.target network-online.target
+Wants=network-online.target
 
 [Service]
 Type=simple
@@ -225,10 +533,10 @@ User=overkill
 Group=overkill
 Environment="HOME=/home/overkill"
 Environment="DISPLAY=:0"
-ExecStartPre=/bin/sh -c 'until systemctl is-active graphical.target; do sleep 1; done'
 ExecStart=/usr/local/bin/kodi-standalone
-Restart=on-failure
+Restart=always
 RestartSec=5
+Nice=-5
 TimeoutStopSec=20
 
 [Install]
@@ -240,18 +548,28 @@ WantedBy=graphical.target
         try:
             with open(service_path, 'w') as f:
                 f.write(service_content)
-            
-            # Reload systemd and enable service
-            run_command(["systemctl", "daemon-reload"])
-            run_command(["systemctl", "enable", "kodi.service"])
-            
-            logger.info("Created and enabled Kodi systemd service")
             return True
             
         except Exception as e:
             logger.error(f"Failed to create systemd service: {e}")
             return False
     
+    def _enable_systemd_service(self) -> bool:
+        """Reload systemd and enable Kodi in a single subprocess"""
+        ret, _, err = run_command(
+            ["sh", "-c", "systemctl daemon-reload && systemctl enable kodi.service"]
+        )
+        if ret != 0:
+            logger.error(f"Failed to enable Kodi service: {err}")
+            return False
+        
+        logger.info("Created and enabled Kodi systemd service")
+        return True
+    
+    def create_systemd_service(self) -> bool:
+        """Create systemd service for Kodi"""
+        return self._write_systemd_service() and self._enable_systemd_service()
+    
     def optimize_for_pi5(self) -> bool:
         """Apply Pi 5 specific optimizations"""
         # Create performance tweaks script
@@ -286,36 +604,67 @@ KODI_HOME=/opt/overkill/kodi/share/kodi \\
             logger.error(f"Failed to create optimization script: {e}")
             return False
     
-    def full_build(self, branch: str = "master") -> bool:
-        """Perform complete Kodi build from source"""
-        logger.info("Starting OVERKILL Kodi build from source...")
+    def install_runtime_files(self) -> bool:
+        """Install symlinks, service and performance script, then enable Kodi"""
+        # Create symlinks in /usr/local/bin
+        self._create_symlinks()
         
-        # Prepare environment
-        if not self.prepare_build_environment():
+        if not self._write_systemd_service():
             return False
         
-        # Get source
-        if not self.clone_or_update_source(branch):
+        if not self.optimize_for_pi5():
             return False
         
-        # Configure
-        if not self.configure_build():
-            return False
+        return self._enable_systemd_service()
+    
+    def full_build(self, branch: str = "master") -> bool:
+        """Perform complete Kodi build from source"""
+        logger.info("Starting OVERKILL Kodi build from source...")
         
-        # Build
-        if not self.build_kodi():
-            return False
+        # apt and git touch disjoint paths, so install dependencies and
+        # fetch the source concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            environment = executor.submit(self.prepare_build_environment)
+            source = executor.submit(self.clone_or_update_source, branch)
+            
+            if not (environment.result() and source.result()):
+                return False
         
-        # Install
-        if not self.install_kodi():
-            return False
+        # Nothing to rebuild when neither source nor flags changed since
+        # the installed build
+        build_id = f"{self._config_fingerprint()}-pgo={self.enable_pgo}"
+        build_id_file = self.install_prefix / ".overkill_build_hash"
+        if (self._source_unchanged
+                and (self.install_prefix / "bin" / "kodi").exists()
+                and build_id_file.exists()
+                and build_id_file.read_text().strip() == build_id):
+            logger.info("Installed Kodi is current, skipping rebuild")
+            return self.install_runtime_files()
         
-        # Create service
-        if not self.create_systemd_service():
-            return False
+        try:
+            if self.enable_pgo:
+                # Configure and build both profile passes
+                if not self.build_kodi_pgo():
+                    return False
+            else:
+                # Configure
+                if not self.configure_build():
+                    return False
+                
+                # Build
+                if not self.build_kodi():
+                    return False
+            
+            # Install
+            if not self.install_kodi():
+                return False
+            atomic_write(build_id_file, build_id)
+        finally:
+            # Only the installed artifacts need to outlive the build
+            self._unmount_build_tmpfs()
         
-        # Optimize
-        if not self.optimize_for_pi5():
+        # Symlinks, service and optimizations
+        if not self.install_runtime_files():
             return False
         
         logger.info("KODI BUILD COMPLETE - MAXIMUM OPTIMIZATION ACHIEVED!")
@@ -1,6 +1,7 @@
 """Kodi configuration management for OVERKILL"""
 
 import os
+import functools
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -8,6 +9,65 @@ from ..core.logger import logger
 from ..core.utils import backup_file, atomic_write, ensure_directory
 
 
+# Static advancedsettings.xml sections
+_ADVANCED_SETTINGS = {
+    "cache": {
+        "buffermode": "1",
+        "memorysize": None,  # Filled in from the requested cache size
+        "readfactor": "20"
+    },
+    "network": {
+        "bandwidth": "0",
+        "readbuffersize": "0",
+        "httptimeout": "30"
+    },
+    "video": {
+        "busydialogdelayms": "500",
+        "percentseekbackward": "-2",
+        "percentseekbackwardbig": "-4",
+        "percentseekforward": "2",
+        "percentseekforwardbig": "4",
+        "blackbarcolour": "1",
+        "fullscreenonexit": "false",
+        "adjustrefreshrate": "1",
+        "stereoscopicregex3d": "[-. _]3d[-. _]",
+        "stereoscopicregexsbs": "[-. _]h?sbs[-. _]",
+        "stereoscopicregextab": "[-. _]h?tab[-. _]"
+    },
+    "audio": {
+        "ac3passthrough": "true",
+        "dtspassthrough": "true",
+        "multichannellpcm": "false",
+        "truehdpassthrough": "true",
+        "dtshdpassthrough": "true"
+    },
+    "gui": {
+        "algorithmdirtyregions": "3",
+        "visualizedirtyregions": "false"
+    },
+    "videodatabase": {
+        "multiplecommits": "5000"
+    },
+    "musicdatabase": {
+        "multiplecommits": "5000"
+    }
+}
+
+
+@functools.lru_cache(maxsize=4)
+def _render_advanced_settings(cache_size: int) -> str:
+    """Render advancedsettings.xml for a cache size in bytes"""
+    root = ET.Element("advancedsettings")
+    root.append(ET.Comment(" OVERKILL Optimized Settings for Pi 5 "))
+    for section, values in _ADVANCED_SETTINGS.items():
+        element = ET.SubElement(root, section)
+        for key, value in values.items():
+            ET.SubElement(element, key).text = str(cache_size) if value is None else value
+    
+    ET.indent(root)
+    return ET.tostring(root, encoding="unicode", xml_declaration=True)
+
+
 class KodiConfigurator:
     """Manage Kodi installation and configuration"""
     
@@ -15,6 +75,8 @@ class KodiConfigurator:
         self.kodi_home = kodi_home or Path("/home/overkill/.kodi")
         self.userdata = self.kodi_home / "userdata"
         self.addons = self.kodi_home / "addons"
+        self._addons_mtime: Optional[int] = None
+        self._addons_cache: List[str] = []
         
     def is_installed(self) -> bool:
         """Check if Kodi is installed"""
@@ -22,12 +84,11 @@ class KodiConfigurator:
     
     def create_directory_structure(self) -> bool:
         """Create Kodi directory structure"""
+        # Leaves only: parents such as userdata and playlists are
+        # created along the way
         directories = [
-            self.kodi_home,
-            self.userdata,
             self.userdata / "addon_data",
             self.userdata / "Database",
-            self.userdata / "playlists",
             self.userdata / "playlists" / "video",
             self.userdata / "playlists" / "music",
             self.userdata / "Thumbnails",
@@ -51,71 +112,12 @@ class KodiConfigurator:
         # Convert MB to bytes
         cache_size = cache_size_mb * 1024 * 1024
         
-        settings = f"""<?xml version="1.0" encoding="UTF-8"?>
-<advancedsettings>
-  <!-- OVERKILL Optimized Settings for Pi 5 -->
-  
-  <!-- Cache Settings -->
-  <cache>
-    <buffermode>1</buffermode>
-    <memorysize>{cache_size}</memorysize>
-    <readfactor>20</readfactor>
-  </cache>
-  
-  <!-- Network Settings -->
-  <network>
-    <bandwidth>0</bandwidth>
-    <readbuffersize>0</readbuffersize>
-    <httptimeout>30</httptimeout>
-  </network>
-  
-  <!-- Video Settings -->
-  <video>
-    <busydialogdelayms>500</busydialogdelayms>
-    <percentseekbackward>-2</percentseekbackward>
-    <percentseekbackwardbig>-4</percentseekbackwardbig>
-    <percentseekforward>2</percentseekforward>
-    <percentseekforwardbig>4</percentseekforwardbig>
-    <blackbarcolour>1</blackbarcolour>
-    <fullscreenonexit>false</fullscreenonexit>
-    <adjustrefreshrate>1</adjustrefreshrate>
-    <stereoscopicregex3d>[-. _]3d[-. _]</stereoscopicregex3d>
-    <stereoscopicregexsbs>[-. _]h?sbs[-. _]</stereoscopicregexsbs>
-    <stereoscopicregextab>[-. _]h?tab[-. _]</stereoscopicregextab>
-  </video>
-  
-  <!-- Audio Settings -->
-  <audio>
-    <ac3passthrough>true</ac3passthrough>
-    <dtspassthrough>true</dtspassthrough>
-    <multichannellpcm>false</multichannellpcm>
-    <truehdpassthrough>true</truehdpassthrough>
-    <dtshdpassthrough>true</dtshdpassthrough>
-  </audio>
-  
-  <!-- GUI Settings -->
-  <gui>
-    <algorithmdirtyregions>3</algorithmdirtyregions>
-    <visualizedirtyregions>false</visualizedirtyregions>
-  </gui>
-  
-  <!-- Database Settings -->
-  <videodatabase>
-    <multiplecommits>5000</multiplecommits>
-  </videodatabase>
-  
-  <musicdatabase>
-    <multiplecommits>5000</multiplecommits>
-  </musicdatabase>
-  
-</advancedsettings>
-"""
+        settings = _render_advanced_settings(cache_size)
         
         try:
             # Backup existing file if present
             advanced_settings_path = self.userdata / "advancedsettings.xml"
-            if advanced_settings_path.exists():
-                backup_file(advanced_settings_path)
+            backup_file(advanced_settings_path, missing_ok=True)
             
             # Write new settings
             return atomic_write(advanced_settings_path, settings)
@@ -127,30 +129,24 @@ class KodiConfigurator:
     def configure_sources(self, sources: Dict[str, List[str]]) -> bool:
         """Configure media sources"""
         
-        sources_xml = """<?xml version="1.0" encoding="UTF-8"?>
-<sources>
-"""
+        root = ET.Element("sources")
         
         for source_type, paths in sources.items():
-            sources_xml += f"    <{source_type}>\n"
-            sources_xml += "        <default pathversion=\"1\"></default>\n"
+            source_type_element = ET.SubElement(root, source_type)
+            ET.SubElement(source_type_element, "default", pathversion="1")
             
-            for i, path in enumerate(paths):
-                sources_xml += f"""        <source>
-            <name>{Path(path).name}</name>
-            <path pathversion="1">{path}</path>
-            <allowsharing>true</allowsharing>
-        </source>
-"""
-            
-            sources_xml += f"    </{source_type}>\n"
+            for path in paths:
+                source = ET.SubElement(source_type_element, "source")
+                ET.SubElement(source, "name").text = Path(path).name
+                ET.SubElement(source, "path", pathversion="1").text = path
+                ET.SubElement(source, "allowsharing").text = "true"
         
-        sources_xml += "</sources>"
+        ET.indent(root)
+        sources_xml = ET.tostring(root, encoding="unicode", xml_declaration=True)
         
         try:
             sources_path = self.userdata / "sources.xml"
-            if sources_path.exists():
-                backup_file(sources_path)
+            backup_file(sources_path, missing_ok=True)
             
             return atomic_write(sources_path, sources_xml)
         
@@ -196,14 +192,25 @@ class KodiConfigurator:
     def get_installed_addons(self) -> List[str]:
         """Get list of installed addons"""
         
+        # The addons directory mtime changes whenever an addon is added or removed
+        try:
+            mtime = self.addons.stat().st_mtime_ns
+        except FileNotFoundError:
+            return []
+        
+        if mtime == self._addons_mtime:
+            return list(self._addons_cache)
+        
         addon_list = []
         
-        if self.addons.exists():
-            for addon_dir in self.addons.iterdir():
-                if addon_dir.is_dir() and (addon_dir / "addon.xml").exists():
-                    addon_list.append(addon_dir.name)
+        with os.scandir(self.addons) as entries:
+            for entry in entries:
+                if entry.is_dir() and os.path.exists(os.path.join(entry.path, "addon.xml")):
+                    addon_list.append(entry.name)
         
-        return addon_list
+        self._addons_mtime = mtime
+        self._addons_cache = addon_list
+        return list(addon_list)
     
     def optimize_for_pi5(self) -> bool:
         """Apply Pi 5 specific optimizations"""
@@ -253,14 +260,9 @@ sleep 10
 # Set display environment
 export DISPLAY=:0.0
 
-# Launch Kodi
-/usr/bin/kodi-standalone
-
-# Restart on crash
-while true; do
-    if ! pgrep -x "kodi" > /dev/null; then
-        /usr/bin/kodi-standalone
-    fi
+# Launch Kodi, restarting it after a crash; this session is not
+# supervised by kodi.service
+until /usr/bin/kodi-standalone; do
     sleep 5
 done
 """
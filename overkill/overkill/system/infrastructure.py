@@ -1,10 +1,23 @@
 """Infrastructure setup for OVERKILL"""
 
+import os
+import pwd
+import grp
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict
 from ..core.logger import logger
-from ..core.utils import ensure_directory, atomic_write
+from ..core.utils import ensure_directory, atomic_write, atomic_write_many
+
+
+_VERSION_TEMPLATE = """OVERKILL_VERSION="3.0.0"
+OVERKILL_CODENAME="PYTHON_POWER"
+OVERKILL_BUILD_DATE="{date}"
+OVERKILL_BUILD_TIME="{time}"
+OVERKILL_MOTTO="UNLIMITED POWER. ZERO RESTRICTIONS."
+OVERKILL_FEATURES="overclock,thermal,kodi_builder,docker,addons"
+"""
 
 
 class InfrastructureManager:
@@ -65,37 +78,53 @@ class InfrastructureManager:
             ]
         }
     
+    def _create_directory(self, category: str, directory: Path) -> bool:
+        """Create one directory with its category's permissions"""
+        if not ensure_directory(directory):
+            logger.error(f"Failed to create {directory}")
+            return False
+        
+        # Set appropriate permissions
+        if category in ["logging", "state"]:
+            directory.chmod(0o755)
+        
+        return True
+    
     def create_all_directories(self) -> bool:
         """Create all OVERKILL directories"""
-        success = True
+        logger.info(f"Creating {', '.join(self.directories)} directories...")
         
-        for category, dirs in self.directories.items():
-            logger.info(f"Creating {category} directories...")
-            for directory in dirs:
-                if not ensure_directory(directory):
-                    logger.error(f"Failed to create {directory}")
-                    success = False
-                else:
-                    # Set appropriate permissions
-                    if category in ["logging", "state"]:
-                        directory.chmod(0o755)
+        # mkdir is independent per path (parents are created with exist_ok),
+        # so overlap the metadata round-trips on slow SD cards
+        all_dirs = [
+            (category, directory)
+            for category, dirs in self.directories.items()
+            for directory in dirs
+        ]
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = list(executor.map(lambda cd: self._create_directory(*cd), all_dirs))
+        success = all(results)
         
-        # Set ownership for user directories
-        import subprocess
-        subprocess.run(["chown", "-R", "overkill:overkill", str(self.media_root)], 
-                      capture_output=True)
+        # Set ownership for user directories; they were just created, so
+        # no recursive walk is needed
+        try:
+            uid = pwd.getpwnam("overkill").pw_uid
+            gid = grp.getgrnam("overkill").gr_gid
+            for directory in self.directories["media"]:
+                os.chown(directory, uid, gid)
+        except (KeyError, OSError) as e:
+            logger.warning(f"Failed to set media directory ownership: {e}")
         
         return success
     
     def create_version_file(self) -> bool:
         """Create OVERKILL version file"""
-        version_content = f"""OVERKILL_VERSION="3.0.0"
-OVERKILL_CODENAME="PYTHON_POWER"
-OVERKILL_BUILD_DATE="{datetime.now().strftime('%Y-%m-%d')}"
-OVERKILL_BUILD_TIME="{datetime.now().strftime('%H:%M:%S')}"
-OVERKILL_MOTTO="UNLIMITED POWER. ZERO RESTRICTIONS."
-OVERKILL_FEATURES="overclock,thermal,kodi_builder,docker,addons"
-"""
+        # One timestamp so date and time can't straddle a second boundary
+        now = datetime.now()
+        version_content = _VERSION_TEMPLATE.format(
+            date=now.strftime('%Y-%m-%d'),
+            time=now.strftime('%H:%M:%S')
+        )
         
         version_file = self.overkill_home / "VERSION"
         return atomic_write(version_file, version_content)
@@ -144,13 +173,7 @@ ctl.!default {
 """
         }
         
-        success = True
-        for relative_path, content in templates.items():
-            file_path = self.overkill_config / relative_path
-            if not atomic_write(file_path, content):
-                success = False
-        
-        return success
+        return atomic_write_many(self.overkill_config, list(templates.items()))
     
     def create_scripts(self) -> bool:
         """Create utility scripts"""
@@ -203,15 +226,8 @@ done
 """
         }
         
-        success = True
-        for script_name, content in scripts.items():
-            script_path = self.overkill_home / "scripts" / script_name
-            if atomic_write(script_path, content):
-                script_path.chmod(0o755)
-            else:
-                success = False
-        
-        return success
+        return atomic_write_many(self.overkill_home / "scripts", list(scripts.items()),
+                                 file_mode=0o755)
     
     def setup_all(self) -> bool:
         """Setup complete infrastructure"""
@@ -1,9 +1,12 @@
 """Kernel optimization for OVERKILL performance"""
 
+import os
+import glob
+import shutil
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 from ..core.logger import logger
-from ..core.utils import atomic_write, backup_file
+from ..core.utils import atomic_write_batch, backup_file, run_command
 
 
 class KernelOptimizer:
@@ -61,60 +64,72 @@ class KernelOptimizer:
             'ACTION=="add|change", KERNEL=="nvme[0-9]*", ATTR{queue/add_random}="0"'
         ]
     
-    def create_sysctl_config(self) -> bool:
-        """Create sysctl configuration file"""
+    def _sysctl_content(self) -> str:
+        """Render the sysctl configuration file"""
+        lines = [
+            "# OVERKILL KERNEL CONFIGURATION",
+            "# Maximum performance settings for Raspberry Pi 5",
+            ""
+        ]
+        lines.extend(f"{param}={value}" for param, value in self.sysctl_params.items())
+        
+        return "\n".join(lines) + "\n"
+    
+    def _udev_content(self) -> str:
+        """Render the NVMe udev rules file"""
+        return "\n".join(self.nvme_rules) + "\n"
+    
+    def _write_configs(self, files: List[Tuple[Path, str]]) -> bool:
+        """Back up and atomically replace configuration files with a single sync"""
         try:
-            content = "# OVERKILL KERNEL CONFIGURATION\n"
-            content += "# Maximum performance settings for Raspberry Pi 5\n\n"
-            
-            for param, value in self.sysctl_params.items():
-                content += f"{param}={value}\n"
+            for file_path, _ in files:
+                backup_file(file_path, missing_ok=True)
             
-            # Backup existing file if present
-            if self.sysctl_file.exists():
-                backup_file(self.sysctl_file)
-            
-            # Write new configuration
-            if atomic_write(self.sysctl_file, content):
-                logger.info("Created kernel optimization configuration")
-                return True
+            return atomic_write_batch(files)
             
         except Exception as e:
-            logger.error(f"Failed to create sysctl config: {e}")
-        
+            logger.error(f"Failed to write kernel configuration: {e}")
+            return False
+    
+    def create_sysctl_config(self) -> bool:
+        """Create sysctl configuration file"""
+        if self._write_configs([(self.sysctl_file, self._sysctl_content())]):
+            logger.info("Created kernel optimization configuration")
+            return True
         return False
     
     def create_udev_rules(self) -> bool:
         """Create udev rules for NVMe optimization"""
-        try:
-            content = "\n".join(self.nvme_rules) + "\n"
-            
-            # Backup existing file if present
-            if self.udev_file.exists():
-                backup_file(self.udev_file)
-            
-            # Write new rules
-            if atomic_write(self.udev_file, content):
-                logger.info("Created NVMe optimization rules")
-                return True
-            
-        except Exception as e:
-            logger.error(f"Failed to create udev rules: {e}")
-        
+        if self._write_configs([(self.udev_file, self._udev_content())]):
+            logger.info("Created NVMe optimization rules")
+            return True
         return False
     
     def apply_runtime_params(self) -> bool:
         """Apply kernel parameters at runtime"""
         try:
-            # Apply sysctl parameters
-            for param, value in self.sysctl_params.items():
-                sysctl_path = f"/proc/sys/{param.replace('.', '/')}"
-                
-                try:
-                    with open(sysctl_path, 'w') as f:
-                        f.write(value)
-                except Exception as e:
-                    logger.warning(f"Failed to set {param}: {e}")
+            if shutil.which("sysctl") and self.sysctl_file.exists():
+                # Let sysctl load the whole file written by create_sysctl_config;
+                # -e skips keys this kernel does not have
+                ret, _, err = run_command(["sysctl", "-q", "-e", "-p", str(self.sysctl_file)])
+                if ret != 0:
+                    logger.warning(f"Some kernel parameters were not applied: {err.strip()}")
+            else:
+                # Apply sysctl parameters with raw writes; /proc/sys files
+                # need no buffering
+                for param, value in self.sysctl_params.items():
+                    sysctl_path = f"/proc/sys/{param.replace('.', '/')}"
+                    
+                    try:
+                        fd = os.open(sysctl_path, os.O_WRONLY)
+                        try:
+                            os.write(fd, value.encode())
+                        finally:
+                            os.close(fd)
+                    except FileNotFoundError:
+                        logger.debug(f"Kernel has no {param}, skipping")
+                    except Exception as e:
+                        logger.warning(f"Failed to set {param}: {e}")
             
             logger.info("Applied runtime kernel parameters")
             return True
@@ -140,14 +155,16 @@ class KernelOptimizer:
             if governor not in available:
                 governor = "ondemand" if "ondemand" in available else available[0]
             
-            # Apply to all CPUs
+            # Apply to all CPUs with frequency scaling
             cpu_count = 0
-            while Path(f"/sys/devices/system/cpu/cpu{cpu_count}").exists():
-                gov_file = Path(f"/sys/devices/system/cpu/cpu{cpu_count}/cpufreq/scaling_governor")
-                if gov_file.exists():
+            for gov_file in glob.glob("/sys/devices/system/cpu/cpu[0-9]*/cpufreq/scaling_governor"):
+                try:
                     with open(gov_file, 'w') as f:
                         f.write(governor)
-                cpu_count += 1
+                    cpu_count += 1
+                except FileNotFoundError:
+                    # CPU went offline since the glob
+                    continue
             
             logger.info(f"Set CPU governor to {governor} for {cpu_count} CPUs")
             return True
@@ -160,11 +177,13 @@ class KernelOptimizer:
         """Apply all kernel optimizations"""
         success = True
         
-        # Create configuration files
-        if not self.create_sysctl_config():
-            success = False
-        
-        if not self.create_udev_rules():
+        # Create both configuration files with a single sync
+        if self._write_configs([
+            (self.sysctl_file, self._sysctl_content()),
+            (self.udev_file, self._udev_content())
+        ]):
+            logger.info("Created kernel optimization configuration and NVMe rules")
+        else:
             success = False
         
         # Apply runtime parameters
@@ -1,9 +1,13 @@
 """Package management for OVERKILL system setup"""
 
 import subprocess
+from datetime import datetime
+from pathlib import Path
 from typing import List, Dict, Optional
 from ..core.logger import logger
-from ..core.utils import run_command
+from ..core.utils import (
+    APT_INSTALL, apt_env, ensure_directory, installed_debs, run_command, run_command_streaming
+)
 
 
 class PackageManager:
@@ -116,7 +120,7 @@ class PackageManager:
     def update_package_list(self) -> bool:
         """Update package list"""
         logger.info("Updating package database...")
-        ret, _, err = run_command(["apt-get", "update"], timeout=300)
+        ret, _, err = run_command(["apt-get", "update"], timeout=300, env=apt_env())
         
         if ret != 0:
             logger.error(f"Failed to update package list: {err}")
@@ -129,17 +133,31 @@ class PackageManager:
         if not packages:
             return True
         
+        try:
+            return self._install_packages(packages)
+        finally:
+            # Even a failed transaction may have installed some packages
+            installed_debs.cache_clear()
+    
+    def _install_packages(self, packages: List[str]) -> bool:
+        """Install packages in one transaction, retrying one by one on failure"""
         logger.info(f"Installing {len(packages)} packages...")
         
-        cmd = ["apt-get", "install", "-y"] + packages
-        ret, stdout, err = run_command(cmd, timeout=600)
+        # Full apt output goes to a log file; only the tail is kept in memory
+        log_dir = Path("/var/log/overkill/builds")
+        ensure_directory(log_dir)
+        log_path = log_dir / f"apt-{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+        logger.info(f"Package install log: {log_path}")
+        
+        ret, err = run_command_streaming(APT_INSTALL + packages, timeout=1800,
+                                         env=apt_env(), log_path=log_path)
         
         if ret != 0:
             logger.error(f"Failed to install packages: {err}")
             # Try to install packages one by one to identify failures
             failed = []
             for package in packages:
-                ret, _, _ = run_command(["apt-get", "install", "-y", package], timeout=120)
+                ret, _, _ = run_command(APT_INSTALL + [package], timeout=120, env=apt_env())
                 if ret != 0:
                     failed.append(package)
             
@@ -167,14 +185,23 @@ class PackageManager:
         if not self.update_package_list():
             return False
         
-        # Install by category
+        # Install every category in one apt transaction; install_packages
+        # retries package by package if the batch fails
         categories = ["build", "python", "libraries", "media", 
                      "kodi_build", "system", "network", "console"]
+        packages = list(dict.fromkeys(
+            package for category in categories for package in self.packages[category]
+        ))
+        
+        # Fetch all archives up front so the install is dpkg-bound only
+        logger.info(f"Downloading {len(packages)} packages...")
+        ret, _, err = run_command(APT_INSTALL + ["--download-only"] + packages,
+                                  timeout=1800, env=apt_env())
+        if ret != 0:
+            logger.warning(f"Failed to download some packages: {err}")
         
-        for category in categories:
-            logger.info(f"Installing {category} packages...")
-            if not self.install_category(category):
-                logger.warning(f"Some {category} packages failed to install")
+        if not self.install_packages(packages):
+            logger.warning("Some packages failed to install")
         
         # Enable Docker service
         run_command(["systemctl", "enable", "docker"])
@@ -187,16 +214,15 @@ class PackageManager:
     
     def check_package_installed(self, package: str) -> bool:
         """Check if a package is installed"""
-        ret, _, _ = run_command(["dpkg", "-l", package])
-        return ret == 0
+        return package in installed_debs()
     
     def get_missing_packages(self) -> List[str]:
         """Get list of missing packages"""
-        missing = []
-        
-        for category, packages in self.packages.items():
-            for package in packages:
-                if not self.check_package_installed(package):
-                    missing.append(package)
+        installed = installed_debs()
         
-        return missing
\ No newline at end of file
+        return [
+            package
+            for packages in self.packages.values()
+            for package in packages
+            if package not in installed
+        ]
\ No newline at end of file
@@ -1,11 +1,43 @@
 """TTY configuration for TV viewing optimization"""
 
 import os
+import re
+import shutil
+import functools
 import subprocess
 from pathlib import Path
 from typing import Optional, Tuple
 from ..core.logger import logger
-from ..core.utils import run_command, atomic_write
+from ..core.utils import installed_debs, run_command, atomic_write
+
+
+# Mode line of `fbset -s`, e.g. mode "1920x1080-60"
+_MODE_RE = re.compile(r'mode\s+"(\d+)x(\d+)')
+
+# Font settings in /etc/default/console-setup
+_FONTFACE_RE = re.compile(r'^FONTFACE=.*$', re.M)
+_FONTSIZE_RE = re.compile(r'^FONTSIZE=.*$', re.M)
+
+
+@functools.lru_cache(maxsize=1)
+def _framebuffer_resolution() -> Optional[Tuple[int, int]]:
+    """Read the framebuffer resolution once from fbset"""
+    try:
+        # Install fbset if not available (at most once, as this is cached)
+        if shutil.which("fbset") is None:
+            logger.info("Installing fbset for resolution detection...")
+            run_command(["apt-get", "install", "-y", "fbset"], timeout=300)
+        
+        # Get resolution from fbset
+        ret, stdout, _ = run_command(["fbset", "-s"])
+        match = _MODE_RE.search(stdout) if ret == 0 else None
+        if match:
+            return int(match.group(1)), int(match.group(2))
+        
+    except Exception as e:
+        logger.debug(f"Failed to get framebuffer resolution: {e}")
+    
+    return None
 
 
 class TTYConfigurator:
@@ -13,6 +45,7 @@ class TTYConfigurator:
     
     def __init__(self):
         self.console_setup_file = Path("/etc/default/console-setup")
+        self._physical_console: Optional[bool] = None
         self.font_faces = {
             "standard": "Fixed",
             "terminus": "TerminusBold",
@@ -29,35 +62,25 @@ class TTYConfigurator:
     
     def is_physical_console(self) -> bool:
         """Check if running on physical console (not SSH)"""
+        if self._physical_console is None:
+            self._physical_console = self._detect_physical_console()
+        return self._physical_console
+    
+    def _detect_physical_console(self) -> bool:
+        """Detect a physical console, trying the SSH environment first"""
+        if os.environ.get("SSH_TTY") or os.environ.get("SSH_CONNECTION"):
+            return False
+        
         try:
             tty = os.ttyname(0)
             return tty.startswith("/dev/tty") and not tty.startswith("/dev/pts")
-        except:
+        except OSError:
+            # stdin is not a terminal
             return False
     
     def get_framebuffer_resolution(self) -> Optional[Tuple[int, int]]:
         """Get framebuffer resolution"""
-        try:
-            # Install fbset if not available
-            if not Path("/usr/bin/fbset").exists():
-                logger.info("Installing fbset for resolution detection...")
-                run_command(["apt-get", "install", "-y", "fbset"])
-            
-            # Get resolution from fbset
-            ret, stdout, _ = run_command(["fbset", "-s"])
-            if ret == 0:
-                for line in stdout.split('\n'):
-                    if 'mode' in line and '"' in line:
-                        # Extract resolution from mode line
-                        mode = line.split('"')[1]
-                        if 'x' in mode:
-                            width, height = mode.split('x')[:2]
-                            return int(width), int(height.split('-')[0])
-            
-        except Exception as e:
-            logger.debug(f"Failed to get framebuffer resolution: {e}")
-        
-        return None
+        return _framebuffer_resolution()
     
     def determine_font_config(self) -> dict:
         """Determine optimal font configuration based on resolution"""
@@ -83,15 +106,13 @@ class TTYConfigurator:
         """Install console fonts if needed"""
         packages = ["console-setup", "console-data", "kbd"]
         
-        missing = []
-        for pkg in packages:
-            ret, _, _ = run_command(["dpkg", "-l", pkg])
-            if ret != 0:
-                missing.append(pkg)
+        installed = installed_debs()
+        missing = [pkg for pkg in packages if pkg not in installed]
         
         if missing:
             logger.info(f"Installing console font packages: {', '.join(missing)}")
             ret, _, err = run_command(["apt-get", "install", "-y"] + missing)
+            installed_debs.cache_clear()
             if ret != 0:
                 logger.error(f"Failed to install font packages: {err}")
                 return False
@@ -102,37 +123,24 @@ class TTYConfigurator:
         """Configure console-setup with optimal settings"""
         try:
             # Read existing configuration
-            config_lines = []
+            content = ""
             if self.console_setup_file.exists():
-                with open(self.console_setup_file, 'r') as f:
-                    config_lines = f.readlines()
+                content = self.console_setup_file.read_text()
             
             # Update or add font settings
             face = self.font_faces[font_config["face"]]
             size = font_config["size"]
             
-            updated = False
-            new_lines = []
-            
-            for line in config_lines:
-                if line.startswith("FONTFACE="):
-                    new_lines.append(f'FONTFACE="{face}"\n')
-                    updated = True
-                elif line.startswith("FONTSIZE="):
-                    new_lines.append(f'FONTSIZE="{size}"\n')
-                    updated = True
-                else:
-                    new_lines.append(line)
-            
-            # Add settings if not found
-            if not updated:
-                new_lines.extend([
-                    f'FONTFACE="{face}"\n',
-                    f'FONTSIZE="{size}"\n'
-                ])
+            for pattern, setting in ((_FONTFACE_RE, f'FONTFACE="{face}"'),
+                                     (_FONTSIZE_RE, f'FONTSIZE="{size}"')):
+                content, count = pattern.subn(setting, content)
+                if count == 0:
+                    if content and not content.endswith("\n"):
+                        content += "\n"
+                    content += setting + "\n"
             
             # Write configuration
-            if atomic_write(self.console_setup_file, ''.join(new_lines)):
+            if atomic_write(self.console_setup_file, content):
                 logger.info(f"Configured console font: {face} {size}")
                 return True
             
@@ -1,12 +1,14 @@
 """User management for OVERKILL"""
 
+import os
 import pwd
 import grp
-import crypt
 import subprocess
+from functools import cached_property
 from typing import List, Optional
+from passlib.hash import sha512_crypt
 from ..core.logger import logger
-from ..core.utils import run_command
+from ..core.utils import atomic_write_batch, run_command
 
 
 class UserManager:
@@ -24,6 +26,26 @@ class UserManager:
             "Music", "Downloads", "Games"
         ]
     
+    @cached_property
+    def _existing_groups(self) -> List[str]:
+        """Supplementary groups that exist on this system, resolved once"""
+        available_groups = {group.gr_name for group in grp.getgrall()}
+        skipped_groups = set(self.groups) - available_groups
+        if skipped_groups:
+            logger.debug(f"Groups do not exist, skipping: {', '.join(sorted(skipped_groups))}")
+        
+        return [group for group in self.groups if group in available_groups]
+    
+    def _hash_password(self, password: str) -> str:
+        """SHA-512 crypt hash with a round count the available backend can afford"""
+        # passlib's pure-Python fallback (no stdlib crypt, e.g. Python 3.13+)
+        # would take tens of seconds on a Pi at passlib's default rounds
+        backend = sha512_crypt.get_backend()
+        rounds = 656000 if backend == "os_crypt" else 5000
+        logger.debug(f"Hashing password with passlib {backend} backend, {rounds} rounds")
+        
+        return sha512_crypt.using(rounds=rounds).hash(password)
+    
     def user_exists(self, username: str) -> bool:
         """Check if user exists"""
         try:
@@ -39,59 +61,29 @@ class UserManager:
                 logger.info(f"User {self.username} already exists")
                 return True
             
-            # Create user
+            # Create user with password and groups in one useradd
             logger.info(f"Creating user {self.username}")
-            ret, _, err = run_command([
+            encrypted_pass = self._hash_password(password)
+            cmd = [
                 "useradd",
                 "-m",  # Create home directory
+                "-U",  # Create a group with the same name
                 "-s", "/bin/bash",  # Shell
                 "-c", "Overkill Media Center",  # Comment
-                self.username
-            ])
+                "-p", encrypted_pass
+            ]
+            # Only request supplementary groups that exist on this system
+            if self._existing_groups:
+                cmd += ["-G", ",".join(self._existing_groups)]
+            ret, _, err = run_command(cmd + [self.username])
             
             if ret != 0:
                 logger.error(f"Failed to create user: {err}")
                 return False
             
-            # Set password
-            encrypted_pass = crypt.crypt(password, crypt.mksalt(crypt.METHOD_SHA512))
-            ret, _, err = run_command([
-                "usermod",
-                "-p", encrypted_pass,
-                self.username
-            ])
-            
-            if ret != 0:
-                logger.error(f"Failed to set password: {err}")
-                return False
-            
-            # Add to groups
-            existing_groups = []
-            for group in self.groups:
-                try:
-                    grp.getgrnam(group)
-                    existing_groups.append(group)
-                except KeyError:
-                    logger.debug(f"Group {group} does not exist, skipping")
-            
-            if existing_groups:
-                groups_str = ",".join(existing_groups)
-                ret, _, err = run_command([
-                    "usermod",
-                    "-a", "-G", groups_str,
-                    self.username
-                ])
-                
-                if ret != 0:
-                    logger.warning(f"Failed to add some groups: {err}")
-            
             # Create home directory structure
             self._create_home_directories()
             
-            # Set ownership
-            home_path = f"/home/{self.username}"
-            run_command(["chown", "-R", f"{self.username}:{self.username}", home_path])
-            
             logger.info(f"User {self.username} created successfully")
             return True
             
@@ -101,11 +93,17 @@ class UserManager:
     
     def _create_home_directories(self) -> None:
         """Create directory structure in user's home"""
-        home_path = f"/home/{self.username}"
+        # Take the home directory useradd actually created
+        home_path = pwd.getpwnam(self.username).pw_dir
+        dir_paths = [os.path.join(home_path, dirname) for dirname in self.home_dirs]
+        
+        # install -d sets owner and mode as it creates, so no chown pass is needed
+        ret, _, err = run_command([
+            "install", "-d", "-o", self.username, "-g", self.username, "-m", "0755", *dir_paths
+        ])
         
-        for dirname in self.home_dirs:
-            dir_path = f"{home_path}/{dirname}"
-            run_command(["sudo", "-u", self.username, "mkdir", "-p", dir_path])
+        if ret != 0:
+            logger.warning(f"Failed to create home directories: {err}")
     
     def grant_sudo_nopasswd(self) -> bool:
         """Grant passwordless sudo access (optional, for convenience)"""
@@ -113,11 +111,10 @@ class UserManager:
             sudoers_content = f"{self.username} ALL=(ALL) NOPASSWD: ALL\n"
             sudoers_file = f"/etc/sudoers.d/{self.username}"
             
-            with open(sudoers_file, 'w') as f:
-                f.write(sudoers_content)
-            
-            # Set proper permissions
-            run_command(["chmod", "0440", sudoers_file])
+            # sudo reads sudoers.d live and ignores names containing a dot,
+            # so the .tmp file is never picked up half-written
+            if not atomic_write_batch([(sudoers_file, sudoers_content)], file_mode=0o440):
+                return False
             
             logger.info(f"Granted passwordless sudo to {self.username}")
             return True
@@ -139,8 +136,8 @@ ExecStart=-/sbin/agetty --autologin {self.username} --noclear %I $TERM
 """
             
             override_file = f"{getty_override_dir}/autologin.conf"
-            with open(override_file, 'w') as f:
-                f.write(override_content)
+            if not atomic_write_batch([(override_file, override_content)], file_mode=0o644):
+                return False
             
             # Reload systemd
             run_command(["systemctl", "daemon-reload"])
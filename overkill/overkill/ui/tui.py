@@ -16,6 +16,23 @@ class MenuItem:
     data: Any = None
 
 
+# OVERKILL ASCII art header
+_HEADER_LINES = [
+    "        ....            _                                       ..         .          ..       .. ",
+    "    .x~X88888Hx.       u                                  < .z@8\"`        @88>  x .d88\"  x .d88\"  ",
+    "   H8X 888888888h.    88Nu.   u.                .u    .    !@88E          %8P    5888R    5888R   ",
+    "  8888:`*888888888:  '88888.o888c      .u     .d88B :@8c   '888E   u       .     '888R    '888R   ",
+    "  88888:        `%8   ^8888  8888   ud8888.  =\"8888f8888r   888E u@8NL   .@88u    888R     888R   ",
+    ". `88888          ?>   8888  8888 :888'8888.   4888>'88\"    888E`\"88*\"  ''888E`   888R     888R   ",
+    "`. ?888%           X   8888  8888 d888 '88%\"   4888> '      888E .dN.     888E    888R     888R   ",
+    "  ~*??.            >   8888  8888 8888.+\"      4888>        888E~8888     888E    888R     888R   ",
+    " .x88888h.        <   .8888b.888P 8888L       .d888L .+     888E '888&    888E    888R     888R   ",
+    ":\"\"\"8888888x..  .x     ^Y8888*\"\"  '8888c. .+  ^\"8888*\"      888E  9888.   888&   .888B .  .888B . ",
+    "`    `*888888888\"        `Y\"       \"88888%       \"Y\"      '\"888*\" 4888\"   R888\"  ^*888%   ^*888%  ",
+    "        \"\"***\"\"                      \"YP'                    \"\"    \"\"      \"\"      \"%       \"%    "
+]
+
+
 class Colors:
     """Color pairs for the TUI"""
     DEFAULT = 0
@@ -28,6 +45,15 @@ class Colors:
     INFO = 7
 
 
+# Color pair for each show_message type
+_MSG_COLORS = {
+    "info": Colors.INFO,
+    "error": Colors.ERROR,
+    "success": Colors.SUCCESS,
+    "warning": Colors.WARNING
+}
+
+
 class BaseWidget(ABC):
     """Base class for TUI widgets"""
     
@@ -58,6 +84,7 @@ class OverkillTUI:
         self.colors_enabled = False
         self.current_menu = []
         self.menu_stack = []
+        self._header_pad = None
         
     def init_colors(self):
         """Initialize color pairs"""
@@ -110,49 +137,44 @@ class OverkillTUI:
             return self.stdscr.getmaxyx()
         return 24, 80  # Default fallback
     
+    def _get_header_pad(self):
+        """Render the ASCII header into an off-screen pad once"""
+        if self._header_pad is None:
+            header_width = max(len(line) for line in _HEADER_LINES)
+            # One spare column so writing the last cell never scrolls the pad
+            pad = curses.newpad(len(_HEADER_LINES), header_width + 1)
+            attr = curses.color_pair(Colors.HEADER) if self.colors_enabled else curses.A_NORMAL
+            for i, line in enumerate(_HEADER_LINES):
+                pad.addstr(i, 0, line, attr)
+            self._header_pad = pad
+        
+        return self._header_pad
+    
     def draw_header(self):
         """Draw OVERKILL ASCII art header"""
         if not self.stdscr:
             return
         
-        self.stdscr.clear()
+        # erase() only blanks the buffer, so the next update sends just the
+        # cells that changed instead of a full clear-screen repaint
+        self.stdscr.erase()
         height, width = self.get_dimensions()
         
-        # ASCII art header
-        header_lines = [
-            "        ....            _                                       ..         .          ..       .. ",
-            "    .x~X88888Hx.       u                                  < .z@8\"`        @88>  x .d88\"  x .d88\"  ",
-            "   H8X 888888888h.    88Nu.   u.                .u    .    !@88E          %8P    5888R    5888R   ",
-            "  8888:`*888888888:  '88888.o888c      .u     .d88B :@8c   '888E   u       .     '888R    '888R   ",
-            "  88888:        `%8   ^8888  8888   ud8888.  =\"8888f8888r   888E u@8NL   .@88u    888R     888R   ",
-            ". `88888          ?>   8888  8888 :888'8888.   4888>'88\"    888E`\"88*\"  ''888E`   888R     888R   ",
-            "`. ?888%           X   8888  8888 d888 '88%\"   4888> '      888E .dN.     888E    888R     888R   ",
-            "  ~*??.            >   8888  8888 8888.+\"      4888>        888E~8888     888E    888R     888R   ",
-            " .x88888h.        <   .8888b.888P 8888L       .d888L .+     888E '888&    888E    888R     888R   ",
-            ":\"\"\"8888888x..  .x     ^Y8888*\"\"  '8888c. .+  ^\"8888*\"      888E  9888.   888&   .888B .  .888B . ",
-            "`    `*888888888\"        `Y\"       \"88888%       \"Y\"      '\"888*\" 4888\"   R888\"  ^*888%   ^*888%  ",
-            "        \"\"***\"\"                      \"YP'                    \"\"    \"\"      \"\"      \"%       \"%    "
-        ]
-        
-        # Calculate starting position for centered header
-        header_height = len(header_lines)
-        header_width = max(len(line) for line in header_lines)
-        
         start_y = 1
-        
-        # Draw header with color
-        for i, line in enumerate(header_lines):
-            if start_y + i < height - 2:  # Leave room for subtitle
-                # Center each line
-                start_x = max(0, (width - len(line)) // 2)
-                try:
-                    if self.colors_enabled:
-                        self.stdscr.attron(curses.color_pair(Colors.HEADER))
-                    self.stdscr.addstr(start_y + i, start_x, line[:width-1])
-                    if self.colors_enabled:
-                        self.stdscr.attroff(curses.color_pair(Colors.HEADER))
-                except curses.error:
-                    pass
+        header_height = len(_HEADER_LINES)
+        
+        # Blit the pre-rendered header, clipped to the screen and leaving
+        # room for the subtitle
+        pad = self._get_header_pad()
+        header_width = pad.getmaxyx()[1] - 1
+        start_x = max(0, (width - header_width) // 2)
+        last_row = min(start_y + header_height, height - 2) - 1
+        last_col = min(start_x + header_width, width - 1) - 1
+        if last_row >= start_y and last_col >= start_x:
+            try:
+                pad.overwrite(self.stdscr, 0, 0, start_y, start_x, last_row, last_col)
+            except curses.error:
+                pass
         
         # Draw subtitle
         subtitle = "Raspberry Pi 5 Media Center Configuration"
@@ -168,12 +190,14 @@ class OverkillTUI:
             except curses.error:
                 pass
     
-    def draw_box(self, y: int, x: int, height: int, width: int, title: str = ""):
+    def draw_box(self, y: int, x: int, height: int, width: int, title: str = "",
+                 screen_dims: Optional[Tuple[int, int]] = None):
         """Draw a box with optional title"""
         if not self.stdscr:
             return
         
-        max_height, max_width = self.get_dimensions()
+        # Callers that already know the screen size pass it in
+        max_height, max_width = screen_dims or self.get_dimensions()
         
         # Ensure box fits in screen
         height = min(height, max_height - y)
@@ -190,14 +214,12 @@ class OverkillTUI:
             self.stdscr.addch(y + height - 1, x + width - 1, curses.ACS_LRCORNER)
             
             # Draw horizontal lines
-            for i in range(1, width - 1):
-                self.stdscr.addch(y, x + i, curses.ACS_HLINE)
-                self.stdscr.addch(y + height - 1, x + i, curses.ACS_HLINE)
+            self.stdscr.hline(y, x + 1, curses.ACS_HLINE, width - 2)
+            self.stdscr.hline(y + height - 1, x + 1, curses.ACS_HLINE, width - 2)
             
             # Draw vertical lines
-            for i in range(1, height - 1):
-                self.stdscr.addch(y + i, x, curses.ACS_VLINE)
-                self.stdscr.addch(y + i, x + width - 1, curses.ACS_VLINE)
+            self.stdscr.vline(y + 1, x, curses.ACS_VLINE, height - 2)
+            self.stdscr.vline(y + 1, x + width - 1, curses.ACS_VLINE, height - 2)
             
             # Draw title if provided
             if title:
@@ -227,78 +249,105 @@ class OverkillTUI:
             return None
         
         self.draw_header()
-        height, width = self.get_dimensions()
-        
-        # Calculate menu dimensions
-        menu_width = min(max(len(title) + 4, max(len(item) for item in items) + 6), width - 4)
-        menu_height = min(len(items) + 4, height - 15)  # Leave room for header
-        
-        # Calculate position (centered)
-        menu_y = max(14, (height - menu_height) // 2)
-        menu_x = (width - menu_width) // 2
-        
+        item_count = len(items)
+        longest_item = max(len(item) for item in items)
         current_selection = selected
+        relayout = True
         
         while True:
-            # Draw menu box
-            self.draw_box(menu_y, menu_x, menu_height, menu_width, title)
-            
-            # Draw menu items
-            visible_items = min(len(items), menu_height - 4)
-            scroll_offset = max(0, current_selection - visible_items + 1)
-            
-            for i in range(visible_items):
-                item_index = i + scroll_offset
-                if item_index >= len(items):
-                    break
+            # Size the menu once, and again only after a terminal resize
+            if relayout:
+                height, width = self.get_dimensions()
+                
+                # Calculate menu dimensions
+                menu_width = min(max(len(title) + 4, longest_item + 6), width - 4)
+                menu_height = min(item_count + 4, height - 15)  # Leave room for header
                 
-                item = items[item_index]
-                y = menu_y + 2 + i
-                x = menu_x + 2
+                # Calculate position (centered)
+                menu_y = max(14, (height - menu_height) // 2)
+                menu_x = (width - menu_width) // 2
                 
-                # Truncate item if too long
+                # Render every item once, truncated and padded, in both its
+                # selected and unselected form
                 max_item_width = menu_width - 4
-                if len(item) > max_item_width:
-                    item = item[:max_item_width-3] + "..."
+                pad_width = max_item_width - 2
+                rendered = []
+                for item in items:
+                    if len(item) > max_item_width:
+                        item = item[:max_item_width-3] + "..."
+                    rendered.append((f"> {item:<{pad_width}}", f"  {item:<{pad_width}}"))
                 
-                try:
-                    if item_index == current_selection:
-                        # Highlight selected item
-                        if self.colors_enabled:
-                            self.stdscr.attron(curses.color_pair(Colors.SELECTED))
-                        self.stdscr.addstr(y, x, f"> {item:<{max_item_width-2}}")
-                        if self.colors_enabled:
-                            self.stdscr.attroff(curses.color_pair(Colors.SELECTED))
-                    else:
-                        self.stdscr.addstr(y, x, f"  {item}")
-                except curses.error:
-                    pass
-            
-            # Draw scroll indicators
-            if scroll_offset > 0:
-                self.stdscr.addstr(menu_y + 1, menu_x + menu_width - 3, "↑")
-            if scroll_offset + visible_items < len(items):
-                self.stdscr.addstr(menu_y + menu_height - 2, menu_x + menu_width - 3, "↓")
+                relayout = False
+                dirty = True
             
-            # Draw help text
-            help_y = menu_y + menu_height + 1
-            if help_y < height - 1:
-                help_text = "↑↓: Navigate | Enter: Select | ESC/q: Cancel"
-                help_x = (width - len(help_text)) // 2
-                try:
-                    self.stdscr.addstr(help_y, help_x, help_text)
-                except curses.error:
-                    pass
-            
-            self.stdscr.refresh()
+            # Only redraw after something changed, not on every idle tick
+            if dirty:
+                # Draw menu box
+                self.draw_box(menu_y, menu_x, menu_height, menu_width, title,
+                              screen_dims=(height, width))
+                
+                # Draw menu items
+                visible_items = min(item_count, menu_height - 4)
+                scroll_offset = max(0, current_selection - visible_items + 1)
+                
+                for i in range(visible_items):
+                    item_index = i + scroll_offset
+                    if item_index >= item_count:
+                        break
+                    
+                    selected_line, plain_line = rendered[item_index]
+                    y = menu_y + 2 + i
+                    x = menu_x + 2
+                    
+                    try:
+                        if item_index == current_selection:
+                            # Highlight selected item
+                            if self.colors_enabled:
+                                self.stdscr.attron(curses.color_pair(Colors.SELECTED))
+                            self.stdscr.addstr(y, x, selected_line)
+                            if self.colors_enabled:
+                                self.stdscr.attroff(curses.color_pair(Colors.SELECTED))
+                        else:
+                            self.stdscr.addstr(y, x, plain_line)
+                    except curses.error:
+                        pass
+                
+                # Draw scroll indicators
+                if scroll_offset > 0:
+                    self.stdscr.addstr(menu_y + 1, menu_x + menu_width - 3, "↑")
+                if scroll_offset + visible_items < item_count:
+                    self.stdscr.addstr(menu_y + menu_height - 2, menu_x + menu_width - 3, "↓")
+                
+                # Draw help text
+                help_y = menu_y + menu_height + 1
+                if help_y < height - 1:
+                    help_text = "↑↓: Navigate | Enter: Select | ESC/q: Cancel"
+                    help_x = (width - len(help_text)) // 2
+                    try:
+                        self.stdscr.addstr(help_y, help_x, help_text)
+                    except curses.error:
+                        pass
+                
+                # Coalesce all drawing into one terminal update
+                self.stdscr.noutrefresh()
+                curses.doupdate()
+                dirty = False
             
             # Handle input
             key = self.stdscr.getch()
             
-            if key == curses.KEY_UP:
-                current_selection = (current_selection - 1) % len(items)
+            if key == -1:
+                # Input timeout, nothing to redraw
+                continue
+            elif key == curses.KEY_UP:
+                current_selection = (current_selection - 1) % item_count
+                dirty = True
             elif key == curses.KEY_DOWN:
-                current_selection = (current_selection + 1) % len(items)
+                current_selection = (current_selection + 1) % item_count
+                dirty = True
+            elif key == curses.KEY_RESIZE:
+                self.draw_header()
+                relayout = True
             elif key == ord('\n') or key == curses.KEY_ENTER:
                 return current_selection
             elif key == 27 or key == ord('q') or key == ord('Q'):  # ESC or q
@@ -325,16 +374,11 @@ class OverkillTUI:
         dialog_x = (width - dialog_width) // 2
         
         # Draw dialog box
-        self.draw_box(dialog_y, dialog_x, dialog_height, dialog_width, title)
+        self.draw_box(dialog_y, dialog_x, dialog_height, dialog_width, title,
+                      screen_dims=(height, width))
         
         # Determine color based on message type
-        color = Colors.INFO
-        if msg_type == "error":
-            color = Colors.ERROR
-        elif msg_type == "success":
-            color = Colors.SUCCESS
-        elif msg_type == "warning":
-            color = Colors.WARNING
+        color = _MSG_COLORS.get(msg_type, Colors.INFO)
         
         # Draw message lines
         for i, line in enumerate(lines[:dialog_height-4]):
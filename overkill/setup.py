@@ -15,7 +15,7 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/flashingcursor/overkill-pi",
-    packages=find_packages(),
+    packages=find_packages(include=["overkill", "overkill.*"], exclude=["tests", "tests.*"]),
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: End Users/Desktop",
@@ -34,6 +34,7 @@ setup(
         "pyyaml>=6.0",
         "psutil>=5.9",
         "requests>=2.28",
+        "passlib>=1.7",
     ],
     extras_require={
         "dev": [
@@ -53,4 +54,8 @@ setup(
         "overkill": ["data/*.yaml", "templates/*.conf"],
     },
     include_package_data=True,
+    zip_safe=False,
+    options={
+        "bdist_wheel": {"python_tag": "py3"},
+    },
 )
\ No newline at end of file